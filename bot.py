@@ -0,0 +1,126 @@
+"""텔레그램 마피아 봇 진입점."""
+
+import logging
+import os
+
+from telegram.ext import Application, CallbackQueryHandler, CommandHandler
+from telegram.request import HTTPXRequest
+
+from mafia_bot.game.game_manager import GameManager
+from mafia_bot.game.phase_manager import PhaseManager
+from mafia_bot.utils import message_utils
+from mafia_bot.utils.settings_manager import SettingsManager
+from mafia_bot.utils.state_manager import StateManager
+
+logging.basicConfig(
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", level=logging.INFO
+)
+
+settings_manager = SettingsManager()
+state_manager = StateManager()
+game_managers = {}
+phase_managers = {}
+
+
+def get_game_manager(chat_id):
+    """채팅방의 GameManager를 반환합니다. 없으면 저장본을 복원합니다."""
+    if chat_id not in game_managers:
+        restored = state_manager.load_game_manager(chat_id)
+        if restored is not None:
+            game_managers[chat_id] = restored
+    return game_managers.get(chat_id)
+
+
+async def start_command(update, context):
+    """/start — 새 게임을 준비합니다."""
+    chat_id = update.effective_chat.id
+    if get_game_manager(chat_id):
+        await message_utils.send_error_message(context, chat_id, "이미 진행 중인 게임이 있습니다.")
+        return
+    settings = settings_manager.get_chat_settings(chat_id)
+    game_managers[chat_id] = GameManager(settings, chat_id)
+    await message_utils.send_message(
+        context, chat_id, "🎮 마피아 게임이 준비되었습니다.\n/join 으로 참가하세요."
+    )
+
+
+async def join_command(update, context):
+    """/join — 게임에 참가합니다."""
+    chat_id = update.effective_chat.id
+    user = update.effective_user
+    game_manager = get_game_manager(chat_id)
+    if not game_manager:
+        await message_utils.send_error_message(context, chat_id, "준비 중인 게임이 없습니다.")
+        return
+    if not game_manager.add_player(user.id, user.first_name):
+        await message_utils.send_error_message(context, chat_id, "게임에 참가할 수 없습니다.")
+        return
+    await message_utils.send_game_status(context, chat_id, game_manager)
+
+
+async def begin_command(update, context):
+    """/begin — 역할을 배정하고 게임을 시작합니다."""
+    chat_id = update.effective_chat.id
+    game_manager = get_game_manager(chat_id)
+    if not game_manager:
+        await message_utils.send_error_message(context, chat_id, "준비 중인 게임이 없습니다.")
+        return
+    if not game_manager.start_game():
+        await message_utils.send_error_message(context, chat_id, "게임을 시작할 수 없습니다.")
+        return
+    state_manager.save_game_manager(chat_id, game_manager)
+    await message_utils.broadcast_role_info(context, game_manager.players)
+    phase_manager = PhaseManager(game_manager)
+    phase_managers[chat_id] = phase_manager
+    phase_manager.start_night_phase()
+    await message_utils.send_phase_change_message(context, chat_id, "밤", game_manager.day_count)
+
+
+async def vote_callback(update, context):
+    """투표 버튼 콜백."""
+    query = update.callback_query
+    await query.answer()
+
+
+async def night_action_callback(update, context):
+    """밤 행동 버튼 콜백."""
+    query = update.callback_query
+    await query.answer()
+
+
+async def _post_shutdown(application):
+    """종료 시 지연된 상태·설정 쓰기를 강제로 플러시합니다."""
+    await state_manager.aclose()
+    await settings_manager.aclose()
+
+
+def main():
+    token = os.environ.get("BOT_TOKEN")
+    # 전송용 커넥션 풀을 넉넉히 잡아 동시 핸들러가 몰려도 풀 고갈로
+    # 대기하지 않게 합니다. 폴링용 풀은 따로 작게 둡니다.
+    request = HTTPXRequest(
+        connection_pool_size=256,
+        connect_timeout=5,
+        read_timeout=20,
+        pool_timeout=30,
+    )
+    application = (
+        Application.builder()
+        .token(token)
+        .request(request)
+        .get_updates_request(HTTPXRequest(connection_pool_size=32))
+        .post_shutdown(_post_shutdown)
+        .build()
+    )
+    application.add_handler(CommandHandler("start", start_command))
+    application.add_handler(CommandHandler("join", join_command))
+    application.add_handler(CommandHandler("begin", begin_command))
+    application.add_handler(CallbackQueryHandler(vote_callback, pattern="^vote"))
+    application.add_handler(
+        CallbackQueryHandler(night_action_callback, pattern="^night_action")
+    )
+    application.run_polling()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+"""텔레그램 마피아 게임 봇."""
+
+__version__ = "0.1.0"
@@ -0,0 +1 @@
+"""게임 진행 로직."""
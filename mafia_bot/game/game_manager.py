@@ -0,0 +1,498 @@
+"""게임 한 판의 상태와 진행을 관리합니다."""
+
+from dataclasses import dataclass
+from typing import Dict
+
+from mafia_bot.game.role_manager import RoleManager
+from mafia_bot.roles.base_role import GameSnapshot, NightAction, Team
+
+
+@dataclass
+class AliveStats:
+    """페이즈 종료 검사 한 번에 쓰이는 생존 집계.
+
+    승리 조건 검사가 역할마다 players를 다시 훑지 않도록 인덱스에서
+    한 번만 만들며, 연인/신도 수는 해당 역할이 배정 시 등록한
+    카운터 콜백으로 채웁니다.
+    """
+
+    total: int
+    by_team: Dict[Team, int]
+    lover_alive: int = 0
+    cultist_alive: int = 0
+
+
+class GameManager:
+    """한 채팅방에서 진행되는 게임의 상태를 관리합니다."""
+
+    def __init__(self, settings, chat_id):
+        self.settings = settings
+        self.chat_id = chat_id
+        self.players = {}
+        self.night_actions = {}
+        self.night_targets = {}
+        self.alive_ids = []
+        self.alive_view = {}
+        # 생존자/팀별 집합 인덱스. 참가·사망 때만 갱신되며 역할들이
+        # C 구현 집합 연산으로 바로 소비합니다.
+        self.alive_set = set()
+        self.team_index = {}
+        self.non_mafia_alive = set()
+        # 역할이 배정될 때 등록하는 생존 통계 카운터(필드명 -> callable).
+        self.stat_counters = {}
+        self.alive_stats = None
+        # 생존/팀 비트마스크. 게임 시작 때 slot을 배정하고 사망 때 비트만 끕니다.
+        self._slot_of = {}
+        self.alive_mask = 0
+        self.team_masks = {}
+        # 불변 대상 튜플 캐시. 사망 등으로 생존자 구성이 바뀔 때만 버립니다.
+        self._alive_targets_cache = None
+        self._non_mafia_targets_cache = None
+        # 생존자 구성이 바뀔 때마다 증가하는 버전. 역할별 대상 캐시의
+        # 유효성 검사에 쓰입니다.
+        self.alive_version = 0
+        # (alive_version, text) — 참가자 목록 텍스트 캐시.
+        self._players_cache = None
+        self.votes = {}
+        self.day_count = 0
+        self.phase = "대기"
+        self.started = False
+        self.role_manager = RoleManager()
+
+    def add_player(self, user_id, name):
+        """게임 시작 전 플레이어를 추가합니다."""
+        if self.started:
+            return False
+        if user_id in self.players:
+            return False
+        if len(self.players) >= self.settings.get("max_players", 20):
+            return False
+        # 플레이어 dict는 항상 name/alive/role 키를 모두 갖습니다.
+        # 핫 패스는 .get 대신 직접 키 접근을 사용합니다.
+        self.players[user_id] = {"name": name, "alive": True, "role": None}
+        self.alive_set.add(user_id)
+        self._invalidate_target_caches()
+        return True
+
+    def remove_player(self, user_id):
+        """게임 시작 전 플레이어를 제거합니다."""
+        if self.started:
+            return False
+        if user_id not in self.players:
+            return False
+        del self.players[user_id]
+        self.alive_set.discard(user_id)
+        self._invalidate_target_caches()
+        return True
+
+    def start_game(self):
+        """역할을 배정하고 게임을 시작합니다."""
+        if self.started:
+            return False
+        if len(self.players) < self.settings.get("min_players", 4):
+            return False
+        assignments = self.role_manager.assign_roles(self.players, self.settings)
+        for player_id, role in assignments.items():
+            self.players[player_id]["role"] = role
+            role.game = self
+            role.on_assigned()
+        self.non_mafia_alive = {
+            player_id
+            for player_id, role in assignments.items()
+            if role.team_id != Team.MAFIA
+        }
+        self.alive_set = set(self.players)
+        self.team_index = {Team.CITIZEN: set(), Team.MAFIA: set(), Team.NEUTRAL: set()}
+        for player_id, role in assignments.items():
+            self.team_index[role.team_id].add(player_id)
+        self._slot_of = {}
+        self.alive_mask = 0
+        self.team_masks = {Team.CITIZEN: 0, Team.MAFIA: 0, Team.NEUTRAL: 0}
+        for slot, (player_id, player) in enumerate(self.players.items()):
+            self._slot_of[player_id] = slot
+            bit = 1 << slot
+            self.alive_mask |= bit
+            self.team_masks[player["role"].team_id] |= bit
+        self._invalidate_target_caches()
+        self.started = True
+        self.day_count = 1
+        return True
+
+    def kill_player(self, player_id):
+        """플레이어를 사망 처리합니다."""
+        player = self.players.get(player_id)
+        if not player or not player["alive"]:
+            return False
+        player["alive"] = False
+        self.alive_set.discard(player_id)
+        role = player["role"]
+        if role is not None:
+            team_ids = self.team_index.get(role.team_id)
+            if team_ids is not None:
+                team_ids.discard(player_id)
+        self.non_mafia_alive.discard(player_id)
+        slot = self._slot_of.get(player_id)
+        if slot is not None:
+            self.alive_mask &= ~(1 << slot)
+        self._invalidate_target_caches()
+        return True
+
+    def replace_role(self, player_id, new_role):
+        """게임 도중 플레이어의 역할을 교체하고 파생 인덱스를 갱신합니다.
+
+        포교처럼 역할이 바뀌는 경로는 players dict에 직접 대입하는 대신
+        이 훅을 거쳐야 team_index·team_masks·non_mafia_alive가 배정
+        시점 그대로 남지 않습니다.
+        """
+        player = self.players.get(player_id)
+        if not player:
+            return False
+        old_role = player["role"]
+        player["role"] = new_role
+        new_role.game = self
+        new_role.on_assigned()
+        slot = self._slot_of.get(player_id)
+        bit = 1 << slot if slot is not None else 0
+        if old_role is not None:
+            team_ids = self.team_index.get(old_role.team_id)
+            if team_ids is not None:
+                team_ids.discard(player_id)
+            if bit and old_role.team_id in self.team_masks:
+                self.team_masks[old_role.team_id] &= ~bit
+        if bit and new_role.team_id in self.team_masks:
+            self.team_masks[new_role.team_id] |= bit
+        if player["alive"]:
+            team_ids = self.team_index.get(new_role.team_id)
+            if team_ids is not None:
+                team_ids.add(player_id)
+            if new_role.team_id != Team.MAFIA:
+                self.non_mafia_alive.add(player_id)
+        if new_role.team_id == Team.MAFIA:
+            self.non_mafia_alive.discard(player_id)
+        self._invalidate_target_caches()
+        return True
+
+    def _invalidate_target_caches(self):
+        self._alive_targets_cache = None
+        self._non_mafia_targets_cache = None
+        self.alive_version += 1
+
+    def alive_targets(self):
+        """생존자 id의 불변 튜플. 구성이 바뀔 때까지 재사용됩니다.
+
+        매 밤 역할 수만큼 list를 새로 만들지 않도록, 사망 시에만
+        무효화되는 캐시를 역할들이 공유합니다.
+        """
+        targets = self._alive_targets_cache
+        if targets is None:
+            targets = tuple(
+                pid for pid, player in self.players.items() if player["alive"]
+            )
+            self._alive_targets_cache = targets
+        return targets
+
+    def non_mafia_targets(self):
+        """마피아가 아닌 생존자 id의 불변 튜플 캐시."""
+        targets = self._non_mafia_targets_cache
+        if targets is None:
+            targets = tuple(self.non_mafia_alive)
+            self._non_mafia_targets_cache = targets
+        return targets
+
+    def get_alive_players(self):
+        """살아있는 플레이어만 담은 dict를 반환합니다."""
+        alive = {}
+        for player_id, player in self.players.items():
+            if player["alive"]:
+                alive[player_id] = player
+        return alive
+
+    def refresh_alive_ids(self):
+        """생존자 id 목록과 생존자 view dict를 페이즈마다 한 번 계산해 둡니다.
+
+        역할들의 get_night_action_targets는 이 목록과 view 위에서만
+        동작하므로 역할 수만큼 players dict를 다시 훑지 않습니다.
+        """
+        alive_view = {
+            pid: player for pid, player in self.players.items() if player["alive"]
+        }
+        self.alive_view = alive_view
+        self.alive_ids = list(alive_view)
+        return self.alive_ids
+
+    def get_night_action_targets(self, player_id):
+        """플레이어 역할의 밤 행동 대상 목록을 반환합니다."""
+        player = self.players.get(player_id)
+        if not player or not player["role"]:
+            return []
+        # 생존자 view만 넘겨 역할별 필터가 생존 검사를 반복하지 않게 합니다.
+        return player["role"].get_night_action_targets(self.alive_ids, self.alive_view)
+
+    def select_night_target(self, player_id, target_id):
+        """플레이어가 고른 밤 행동 대상을 기록합니다."""
+        player = self.players.get(player_id)
+        if not player or not player["alive"]:
+            return False
+        role = player["role"]
+        if not role or not role.night_action:
+            return False
+        self.night_targets[player_id] = target_id
+        return True
+
+    def process_night_actions(self):
+        """밤 행동을 우선순위순 단일 스윕으로 수행·해소합니다.
+
+        역할별 perform 호출, 방문 기록(_visits), 치료-살해 교차 검사
+        (_kill_blocked)를 엔진이 한 번의 패스에서 함께 처리하므로
+        Reporter/Doctor가 night_actions를 다시 훑지 않습니다.
+        사망자 id 목록을 반환합니다.
+        """
+        visits = {}
+        actions = []
+        self.night_actions = {"_visits": visits, "actions": actions}
+
+        acting_roles = []
+        for player_id, player in self.players.items():
+            if not player["alive"]:
+                continue
+            role = player["role"]
+            if role and role.night_action and player_id in self.night_targets:
+                acting_roles.append(role)
+        acting_roles.sort(key=lambda r: r.priority, reverse=True)
+
+        for role in acting_roles:
+            target_id = self.night_targets[role.player_id]
+            role.perform_night_action(target_id, self.players, self.night_actions)
+            # 방문 기록과 정규 행동 로그는 역할이 아니라 엔진이 남깁니다.
+            if role.target_count == 1:
+                actions.append(NightAction(role.name, role.player_id, target_id))
+            if role.visits:
+                visits.setdefault(target_id, []).append(role.player_id)
+
+        for player_id, player in self.players.items():
+            if player["alive"] and player["role"]:
+                player["role"].on_night_end(self.players, self.night_actions)
+
+        kill = self.night_actions.get("mafia_kill")
+        healed_ids = {
+            heal["target_id"]
+            for heal in self.night_actions.get("doctor_heal", {}).values()
+        }
+        kill_blocked = bool(kill and kill.get("target_id") in healed_ids)
+        self.night_actions["_kill_blocked"] = kill_blocked
+
+        deaths = []
+        if kill and not kill_blocked:
+            if self.kill_player(kill["target_id"]):
+                deaths.append(kill["target_id"])
+        for action_key in ("psycho_kill", "serial_kill", "witch_poison"):
+            action = self.night_actions.get(action_key)
+            if action:
+                if action.get("target_id") in healed_ids:
+                    continue
+                if self.kill_player(action["target_id"]):
+                    deaths.append(action["target_id"])
+
+        # 도둑의 역할 복제는 행동이 확정된 지금에서야 수행합니다.
+        steal = self.night_actions.get("thief_steal")
+        if steal:
+            thief = self.players.get(steal["thief_id"])
+            target = self.players.get(steal.get("target_id"))
+            if thief and thief["alive"] and target and target["role"] is not None:
+                stolen = type(target["role"])(steal["thief_id"])
+                thief["role"].stolen_role = stolen
+                steal["stolen_role"] = stolen
+
+        self.night_targets = {}
+        return deaths
+
+    def get_day_start_messages(self):
+        """낮 시작 시 역할 훅이 만든 공지 메시지 목록을 반환합니다."""
+        messages = []
+        for player_id, player in self.players.items():
+            if not player["alive"]:
+                continue
+            role = player["role"]
+            if not role:
+                continue
+            message = role.on_day_start(self.players, self.night_actions)
+            if message:
+                messages.append(message)
+        return messages
+
+    def vote(self, voter_id, target_id):
+        """투표를 기록합니다."""
+        voter = self.players.get(voter_id)
+        target = self.players.get(target_id)
+        if not voter or not voter["alive"]:
+            return False
+        if not target or not target["alive"]:
+            return False
+        self.votes[voter_id] = target_id
+        return True
+
+    def process_vote_results(self):
+        """투표를 집계해 (처형된 플레이어 id 또는 None, 득표 dict)를 반환합니다."""
+        vote_results = {}
+        for voter_id, target_id in self.votes.items():
+            voter = self.players.get(voter_id)
+            weight = 1
+            if voter and voter["role"]:
+                weight = voter["role"].on_voted(self.players)
+            vote_results[target_id] = vote_results.get(target_id, 0) + weight
+        self.votes = {}
+
+        if not vote_results:
+            return None, vote_results
+
+        max_votes = max(vote_results.values())
+        top_targets = [t for t, v in vote_results.items() if v == max_votes]
+        if len(top_targets) != 1:
+            return None, vote_results
+
+        executed_id = top_targets[0]
+        self.kill_player(executed_id)
+        return executed_id, vote_results
+
+    def compute_alive_stats(self):
+        """생존 집계를 인덱스와 등록된 카운터에서 만들어 캐시합니다."""
+        counters = self.stat_counters
+        alive = self.alive_set
+        self.alive_stats = AliveStats(
+            total=len(alive),
+            by_team={team: len(ids) for team, ids in self.team_index.items()},
+            lover_alive=counters["lover_alive"](alive)
+            if "lover_alive" in counters
+            else 0,
+            cultist_alive=counters["cultist_alive"](alive)
+            if "cultist_alive" in counters
+            else 0,
+        )
+        return self.alive_stats
+
+    def check_game_end(self):
+        """승리한 팀 이름을 반환하고, 아직 없으면 None을 반환합니다."""
+        self.compute_alive_stats()
+        if self.started and self._slot_of:
+            # 시작 이후에는 증분 관리되는 마스크를 스캔 없이 그대로 씁니다.
+            snap = GameSnapshot.from_masks(
+                self._slot_of, self.alive_mask, self.team_masks
+            )
+        else:
+            snap = GameSnapshot.capture(self.players)
+        for player_id, player in self.players.items():
+            role = player["role"]
+            if role and role.check_win_condition(self.players, snap):
+                return role.team
+        return None
+
+    def to_dict(self):
+        """저장 가능한 원시 컨테이너로 게임 상태를 직렬화합니다.
+
+        파생 인덱스(집합·마스크·캐시)는 저장하지 않고 복원 시
+        _rebuild_indexes로 다시 만듭니다. 역할은 클래스 이름과
+        get_state가 돌려준 상태만 기록합니다.
+        """
+        return {
+            "chat_id": self.chat_id,
+            "settings": dict(self.settings),
+            "day_count": self.day_count,
+            "phase": self.phase,
+            "started": self.started,
+            "players": {
+                player_id: {
+                    "name": player["name"],
+                    "alive": player["alive"],
+                    "role": type(player["role"]).__name__
+                    if player["role"] is not None
+                    else None,
+                    "role_state": player["role"].get_state()
+                    if player["role"] is not None
+                    else None,
+                }
+                for player_id, player in self.players.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """to_dict가 만든 스냅샷에서 GameManager를 복원합니다."""
+        import mafia_bot.roles as roles
+
+        manager = cls(data["settings"], data["chat_id"])
+        manager.day_count = data.get("day_count", 0)
+        manager.phase = data.get("phase", "대기")
+        manager.started = data.get("started", False)
+        saved_players = data.get("players", {})
+        for key, saved in saved_players.items():
+            player_id = int(key)
+            player = {"name": saved["name"], "alive": saved["alive"], "role": None}
+            role_name = saved.get("role")
+            if role_name:
+                role_cls = getattr(roles, role_name, None)
+                if role_cls is not None:
+                    role = role_cls(player_id)
+                    role.game = manager
+                    player["role"] = role
+            manager.players[player_id] = player
+        manager._rebuild_indexes()
+        # 복원된 교도들이 제각각 그룹 사본을 들지 않도록 공유 그룹 하나로
+        # 다시 묶습니다. 신도 집합은 이어지는 set_state가 채웁니다.
+        shared_group = None
+        for player in manager.players.values():
+            role = player["role"]
+            if isinstance(role, roles.Cultist):
+                if shared_group is None:
+                    shared_group = role.group
+                else:
+                    role.group = shared_group
+        # 상태 복원은 인덱스·카운터가 모두 자리잡은 뒤에 합니다.
+        for key, saved in saved_players.items():
+            role = manager.players[int(key)]["role"]
+            state = saved.get("role_state")
+            if role is not None and state:
+                role.set_state(state)
+        return manager
+
+    def _rebuild_indexes(self):
+        """players dict만으로 파생 인덱스 전부를 다시 만듭니다."""
+        self.alive_set = {
+            pid for pid, player in self.players.items() if player["alive"]
+        }
+        self.team_index = {Team.CITIZEN: set(), Team.MAFIA: set(), Team.NEUTRAL: set()}
+        self.non_mafia_alive = set()
+        self._slot_of = {}
+        self.alive_mask = 0
+        self.team_masks = {Team.CITIZEN: 0, Team.MAFIA: 0, Team.NEUTRAL: 0}
+        for slot, (player_id, player) in enumerate(self.players.items()):
+            role = player["role"]
+            if role is None:
+                continue
+            self._slot_of[player_id] = slot
+            bit = 1 << slot
+            self.team_masks[role.team_id] |= bit
+            if player["alive"]:
+                self.alive_mask |= bit
+                self.team_index[role.team_id].add(player_id)
+                if role.team_id != Team.MAFIA:
+                    self.non_mafia_alive.add(player_id)
+            role.on_assigned()
+        self._invalidate_target_caches()
+
+    def get_player_list_text(self):
+        """현재 플레이어 목록 텍스트를 반환합니다.
+
+        목록은 참가·퇴장·사망 때만 바뀌므로 alive_version으로 스탬프한
+        캐시를 재사용합니다. 상태 메시지가 초 단위로 갱신돼도 같은
+        문자열을 다시 만들지 않습니다.
+        """
+        cached = self._players_cache
+        if cached is not None and cached[0] == self.alive_version:
+            return cached[1]
+        parts = [f"👥 참가자 ({len(self.players)}명)\n"]
+        for player_id, player in self.players.items():
+            status = "🟢" if player["alive"] else "⚰️"
+            parts.append(f"{status} {player['name']}\n")
+        text = "".join(parts)
+        self._players_cache = (self.alive_version, text)
+        return text
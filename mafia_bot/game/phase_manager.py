@@ -0,0 +1,67 @@
+"""낮/밤/투표 단계 전환을 관리합니다."""
+
+import threading
+
+
+class PhaseManager:
+    """타이머 기반으로 게임 단계를 전환합니다."""
+
+    def __init__(self, game_manager, on_phase_end=None):
+        self.game_manager = game_manager
+        self.on_phase_end = on_phase_end
+        self.timer = None
+
+    def _schedule(self, duration, callback):
+        self.cancel()
+        self.timer = threading.Timer(duration, callback)
+        self.timer.daemon = True
+        self.timer.start()
+
+    def start_night_phase(self, duration=None):
+        """밤 단계를 시작합니다."""
+        if duration is None:
+            duration = self.game_manager.settings.get("night_duration", 60)
+        self.game_manager.phase = "밤"
+        self.game_manager.refresh_alive_ids()
+        self._schedule(duration, self.end_night_phase)
+
+    def end_night_phase(self):
+        """밤 행동을 해소하고 낮 단계로 넘어갑니다."""
+        deaths = self.game_manager.process_night_actions()
+        if self.on_phase_end:
+            self.on_phase_end("밤", deaths)
+        self.start_day_phase()
+
+    def start_day_phase(self, duration=None):
+        """낮 단계를 시작합니다."""
+        if duration is None:
+            duration = self.game_manager.settings.get("day_duration", 120)
+        self.game_manager.phase = "낮"
+        self.game_manager.day_count += 1
+        self._schedule(duration, self.end_day_phase)
+
+    def end_day_phase(self):
+        """낮 토론을 마치고 투표 단계로 넘어갑니다."""
+        if self.on_phase_end:
+            self.on_phase_end("낮", None)
+        self.start_vote_phase()
+
+    def start_vote_phase(self, duration=None):
+        """투표 단계를 시작합니다."""
+        if duration is None:
+            duration = self.game_manager.settings.get("vote_duration", 30)
+        self.game_manager.phase = "투표"
+        self._schedule(duration, self.end_vote_phase)
+
+    def end_vote_phase(self):
+        """투표를 집계하고 밤 단계로 넘어갑니다."""
+        executed_id, vote_results = self.game_manager.process_vote_results()
+        if self.on_phase_end:
+            self.on_phase_end("투표", (executed_id, vote_results))
+        self.start_night_phase()
+
+    def cancel(self):
+        """예약된 단계 전환 타이머를 취소합니다."""
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
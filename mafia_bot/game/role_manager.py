@@ -0,0 +1,68 @@
+"""역할 배정을 담당합니다."""
+
+import random
+
+from mafia_bot.roles import (
+    Agitator,
+    Architect,
+    Bomber,
+    BusDriver,
+    Citizen,
+    Cultist,
+    Cupid,
+    Detective,
+    Doctor,
+    Mafia,
+    Psycho,
+    Reporter,
+    SerialKiller,
+    Thief,
+    Witch,
+)
+
+ROLE_CLASSES = {
+    "마피아": Mafia,
+    "경찰": Detective,
+    "의사": Doctor,
+    "기자": Reporter,
+    "선동가": Agitator,
+    "버스기사": BusDriver,
+    "싸이코": Psycho,
+    "마녀": Witch,
+    "폭탄마": Bomber,
+    "건축가": Architect,
+    "연쇄살인마": SerialKiller,
+    "교주": Cultist,
+    "큐피드": Cupid,
+    "도둑": Thief,
+}
+
+
+class RoleManager:
+    """설정에 따라 플레이어에게 역할을 배정합니다."""
+
+    def assign_roles(self, players, settings):
+        """플레이어 id -> 역할 인스턴스 매핑을 반환합니다."""
+        player_ids = list(players.keys())
+        random.shuffle(player_ids)
+
+        enabled_roles = settings.get("enabled_roles", {})
+        role_counts = settings.get("role_counts", {})
+
+        role_classes = []
+        for role_name, count in role_counts.items():
+            if not enabled_roles.get(role_name, True):
+                continue
+            role_class = ROLE_CLASSES.get(role_name)
+            if role_class is None:
+                continue
+            role_classes.extend([role_class] * count)
+
+        role_classes = role_classes[: len(player_ids)]
+        while len(role_classes) < len(player_ids):
+            role_classes.append(Citizen)
+
+        assignments = {}
+        for player_id, role_class in zip(player_ids, role_classes):
+            assignments[player_id] = role_class(player_id)
+        return assignments
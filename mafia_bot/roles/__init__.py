@@ -0,0 +1,28 @@
+"""역할 클래스 모음."""
+
+from mafia_bot.roles.base_role import BaseRole
+from mafia_bot.roles.citizen_roles import Agitator, Citizen, Detective, Doctor, Reporter
+from mafia_bot.roles.mafia_roles import Mafia
+from mafia_bot.roles.mafia_with_sub_role import MafiaWithSubRole
+from mafia_bot.roles.neutral_roles import Cultist, Cupid, SerialKiller, Thief
+from mafia_bot.roles.special_roles import Architect, Bomber, BusDriver, Psycho, Witch
+
+__all__ = [
+    "BaseRole",
+    "Citizen",
+    "Detective",
+    "Doctor",
+    "Reporter",
+    "Agitator",
+    "Mafia",
+    "MafiaWithSubRole",
+    "SerialKiller",
+    "Cultist",
+    "Cupid",
+    "Thief",
+    "BusDriver",
+    "Psycho",
+    "Witch",
+    "Bomber",
+    "Architect",
+]
@@ -0,0 +1,183 @@
+"""모든 역할의 기본 클래스를 정의합니다."""
+
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import ClassVar, Dict
+
+from mafia_bot.roles.constants import TEAM_CITIZEN, TEAM_MAFIA, TEAM_NEUTRAL
+
+
+class Team(IntEnum):
+    """역할이 속한 팀. 핫 패스 비교는 문자열 대신 정수로 합니다."""
+
+    CITIZEN = 0
+    MAFIA = 1
+    NEUTRAL = 2
+
+
+_TEAM_NAMES = {
+    Team.CITIZEN: TEAM_CITIZEN,
+    Team.MAFIA: TEAM_MAFIA,
+    Team.NEUTRAL: TEAM_NEUTRAL,
+}
+
+
+@dataclass(slots=True)
+class NightAction:
+    """밤 행동 한 건의 정규 레코드.
+
+    역할별 dict 외에 엔진이 수행 순서대로 쌓는 공용 로그의 원소로,
+    kind는 행동한 역할 이름입니다.
+    """
+
+    kind: str
+    actor_id: int
+    target_id: int
+
+
+@dataclass
+class GameSnapshot:
+    """플레이어별 생존/팀 정보를 비트마스크로 담은 스냅샷.
+
+    승리 조건 검사가 플레이어 dict를 역할마다 다시 훑지 않도록,
+    밤이 끝날 때 한 번 만들어 모든 check_win_condition에 전달합니다.
+    alive_mask의 slot번째 비트가 생존 여부, team_masks[팀]은 그 팀
+    소속 전원의 비트입니다. 팀별 생존자 수는 AND 한 번과 네이티브
+    popcount(int.bit_count)로 나옵니다.
+    """
+
+    index: Dict[int, int]
+    alive_mask: int
+    team_masks: Dict[Team, int]
+
+    @classmethod
+    def capture(cls, players):
+        """players dict를 한 번 훑어 비트마스크 스냅샷을 만듭니다."""
+        index = {}
+        alive_mask = 0
+        team_masks = {Team.CITIZEN: 0, Team.MAFIA: 0, Team.NEUTRAL: 0}
+        for slot, (player_id, player) in enumerate(players.items()):
+            index[player_id] = slot
+            role = player.get("role")
+            if role and player.get("alive", True):
+                bit = 1 << slot
+                alive_mask |= bit
+                team_masks[role.team_id] |= bit
+        return cls(index, alive_mask, team_masks)
+
+    @classmethod
+    def from_masks(cls, index, alive_mask, team_masks):
+        """엔진이 증분 관리하는 마스크를 스캔 없이 그대로 감쌉니다."""
+        return cls(index, alive_mask, team_masks)
+
+    def count(self, team_code):
+        """해당 팀의 생존자 수. AND + popcount 두 연산이면 끝납니다."""
+        return (self.alive_mask & self.team_masks[team_code]).bit_count()
+
+    def is_alive(self, player_id):
+        slot = self.index.get(player_id)
+        return slot is not None and (self.alive_mask >> slot) & 1 == 1
+
+
+def make_target_filter(predicate):
+    """술어를 인라인한 대상 필터 함수를 exec로 한 번 컴파일해 돌려줍니다.
+
+    역할별 get_night_action_targets는 술어만 다르고 모양이 같으므로
+    클래스 정의 시점에 특수화된 변형을 만들어, 호출마다 해석되는
+    분기와 self 속성 조회를 comprehension 안으로 인라인합니다.
+    """
+    source = (
+        "def get_night_action_targets(self, alive_ids, players):\n"
+        f"    return [pid for pid in alive_ids if {predicate}]\n"
+    )
+    namespace = {"Team": Team}
+    exec(source, namespace)
+    return namespace["get_night_action_targets"]
+
+
+class BaseRole:
+    """모든 역할이 상속하는 기본 클래스.
+
+    역할은 플레이어 한 명에게 배정되며, 밤 행동과 승리 조건을 정의합니다.
+    이름·설명 같은 불변 메타데이터는 클래스 속성으로 공유해
+    인스턴스마다 중복 저장하지 않습니다.
+    """
+
+    __slots__ = ("player_id", "game")
+
+    name: ClassVar[str] = "시민"
+    description: ClassVar[str] = ""
+    team_id: ClassVar[Team] = Team.CITIZEN
+    night_action: ClassVar[bool] = False
+    priority: ClassVar[int] = 0
+    target_count: ClassVar[int] = 1
+    is_psycho: ClassVar[bool] = False
+    # True면 밤 행동이 대상의 집을 방문한 것으로 기자에게 목격됩니다.
+    # 방문 기록 자체는 밤 해소 엔진이 스윕하면서 한 번에 남깁니다.
+    visits: ClassVar[bool] = False
+
+    def __init__(self, player_id):
+        self.player_id = player_id
+        # 게임 컨텍스트 역참조. GameManager가 역할을 배정할 때 채워 주며,
+        # 역할이 증분 관리되는 인덱스(non_mafia_alive 등)를 읽을 때 씁니다.
+        self.game = None
+
+    @property
+    def team(self):
+        """팀의 한국어 이름. 기존 문자열 기반 호출자와의 호환용입니다."""
+        return _TEAM_NAMES[self.team_id]
+
+    def get_night_action_targets(self, alive_ids, players):
+        """밤 행동 대상이 될 수 있는 플레이어 id 목록을 반환합니다.
+
+        alive_ids는 호출자가 밤마다 한 번 계산해 전달하는 생존자 id
+        목록입니다. 역할별 필터는 이 목록 위에서만 동작합니다.
+        """
+        return list(alive_ids)
+
+    def _targets_except_self(self, alive_ids):
+        """alive_ids에서 자신만 뺀 대상 목록. 역할 공통 필터입니다."""
+        return [pid for pid in alive_ids if pid != self.player_id]
+
+    def perform_night_action(self, target_id, players, night_actions):
+        """밤 행동을 수행하고 night_actions에 기록합니다."""
+        return night_actions
+
+    def get_night_action_result(self, players, night_actions):
+        """밤 행동의 결과 메시지를 반환합니다. 없으면 None."""
+        return None
+
+    def check_win_condition(self, players, snap=None):
+        """이 역할(의 팀)이 승리했는지 확인합니다.
+
+        snap에는 호출자가 미리 만든 GameSnapshot이 들어옵니다.
+        """
+        return False
+
+    def on_assigned(self):
+        """역할이 게임에 배정돼 game 역참조가 채워진 직후 호출되는 훅."""
+        return None
+
+    def get_state(self):
+        """저장할 역할별 가변 상태를 원시 컨테이너로 반환합니다."""
+        return {}
+
+    def set_state(self, state):
+        """get_state가 만든 상태를 복원합니다."""
+        return None
+
+    def on_night_end(self, players, night_actions):
+        """밤이 끝날 때 호출되는 훅."""
+        return None
+
+    def on_day_start(self, players, night_actions):
+        """낮이 시작될 때 호출되는 훅. 공지 메시지를 반환할 수 있습니다."""
+        return None
+
+    def on_voted(self, players):
+        """투표할 때 이 플레이어의 표 가중치를 반환합니다."""
+        return 1
+
+    def get_role_info(self):
+        """역할 설명 텍스트를 반환합니다."""
+        return self.description
@@ -0,0 +1,227 @@
+"""시민팀 역할들을 정의합니다."""
+
+from typing import ClassVar
+
+from mafia_bot.roles.base_role import BaseRole, GameSnapshot, Team, make_target_filter
+
+
+class Citizen(BaseRole):
+    """기본 시민 역할. 밤 행동이 없습니다."""
+
+    __slots__ = ()
+
+    name: ClassVar[str] = "시민"
+    description: ClassVar[str] = "👤 **시민**\n특별한 능력은 없지만 투표로 마피아를 찾아내야 합니다."
+
+    def perform_night_action(self, _target_id, _players, night_actions):
+        return night_actions
+
+    def check_win_condition(self, players, snap=None):
+        if snap is None:
+            snap = GameSnapshot.capture(players)
+        return snap.count(Team.MAFIA) == 0 and snap.count(Team.CITIZEN) > 0
+
+
+class Detective(BaseRole):
+    """경찰. 밤마다 한 명을 조사해 소속 팀을 알아냅니다."""
+
+    __slots__ = ()
+
+    name: ClassVar[str] = "경찰"
+    description: ClassVar[str] = "🔍 **경찰**\n밤마다 한 명을 조사해 마피아인지 알아낼 수 있습니다."
+    night_action: ClassVar[bool] = True
+    priority: ClassVar[int] = 60
+    visits: ClassVar[bool] = True
+
+    _MSG_FAILED: ClassVar[str] = "조사에 실패했습니다."
+    _TEAM_MSG: ClassVar[dict] = {
+        Team.MAFIA: "조사 결과: {}은(는) 마피아팀입니다!",
+        Team.CITIZEN: "조사 결과: {}은(는) 시민팀입니다.",
+        Team.NEUTRAL: "조사 결과: {}은(는) 중립팀입니다.",
+    }
+
+    get_night_action_targets = make_target_filter("pid != self.player_id")
+
+    def perform_night_action(self, target_id, players, night_actions):
+        # 경찰별 항목을 player_id로 인덱싱해 경찰이 여럿이어도 지워지지 않습니다.
+        night_actions.setdefault("detective_investigate", {})[self.player_id] = {
+            "target_id": target_id,
+        }
+        return night_actions
+
+    def get_night_action_result(self, players, night_actions):
+        investigation = night_actions.get("detective_investigate", {}).get(
+            self.player_id
+        )
+        if not investigation:
+            return None
+        target_id = investigation.get("target_id")
+        target = players.get(target_id)
+        if not target or not target["role"]:
+            return self._MSG_FAILED
+        template = self._TEAM_MSG.get(target["role"].team_id)
+        if template is None:
+            return self._MSG_FAILED
+        return template.format(target.get("name", "알 수 없음"))
+
+    def check_win_condition(self, players, snap=None):
+        return Citizen.check_win_condition(self, players, snap)
+
+
+class Doctor(BaseRole):
+    """의사. 밤마다 한 명을 치료해 마피아의 공격을 막습니다."""
+
+    __slots__ = ("self_heal_count",)
+
+    name: ClassVar[str] = "의사"
+    description: ClassVar[str] = "💉 **의사**\n밤마다 한 명을 치료해 마피아의 공격에서 보호합니다."
+    night_action: ClassVar[bool] = True
+    priority: ClassVar[int] = 50
+    visits: ClassVar[bool] = True
+
+    _MSG_SELF_HEAL: ClassVar[str] = "오늘 밤 자신을 치료했습니다."
+    _MSG_HEAL: ClassVar[str] = "오늘 밤 {name}을(를) 치료했습니다."
+    _MSG_SAVED: ClassVar[str] = "💉 의사가 {name}을(를) 치료해 목숨을 구했습니다!"
+
+    def __init__(self, player_id):
+        super().__init__(player_id)
+        self.self_heal_count = 1
+
+    def get_state(self):
+        return {"self_heal_count": self.self_heal_count}
+
+    def set_state(self, state):
+        self.self_heal_count = state.get("self_heal_count", 1)
+
+    def get_night_action_targets(self, alive_ids, players):
+        game = self.game
+        if game is not None:
+            targets = game.alive_targets()
+            if self.self_heal_count > 0:
+                return targets
+            return tuple(pid for pid in targets if pid != self.player_id)
+        return self._filter_targets(alive_ids, players)
+
+    _filter_targets = make_target_filter(
+        "pid != self.player_id or self.self_heal_count > 0"
+    )
+
+    def perform_night_action(self, target_id, players, night_actions):
+        if target_id == self.player_id:
+            if self.self_heal_count <= 0:
+                return night_actions
+            self.self_heal_count -= 1
+        night_actions.setdefault("doctor_heal", {})[self.player_id] = {
+            "target_id": target_id,
+        }
+        return night_actions
+
+    def get_night_action_result(self, players, night_actions):
+        heal = night_actions.get("doctor_heal", {}).get(self.player_id)
+        if not heal:
+            return None
+        target_id = heal.get("target_id")
+        if target_id == self.player_id:
+            return self._MSG_SELF_HEAL
+        target = players.get(target_id)
+        target_name = target.get("name", "알 수 없음") if target else "알 수 없음"
+        return self._MSG_HEAL.format(name=target_name)
+
+    def on_day_start(self, players, night_actions):
+        # 치료-살해 교차 검사는 밤 해소 엔진이 미리 끝내 둡니다.
+        if not night_actions.get("_kill_blocked"):
+            return None
+        heal = night_actions.get("doctor_heal", {}).get(self.player_id)
+        kill = night_actions.get("mafia_kill")
+        if not heal or not kill or heal["target_id"] != kill["target_id"]:
+            return None
+        target = players.get(heal["target_id"])
+        target_name = target.get("name", "알 수 없음") if target else "알 수 없음"
+        return self._MSG_SAVED.format(name=target_name)
+
+    def check_win_condition(self, players, snap=None):
+        return Citizen.check_win_condition(self, players, snap)
+
+
+class Reporter(BaseRole):
+    """기자. 밤마다 한 명을 취재해 그 집을 방문한 사람을 알아냅니다."""
+
+    __slots__ = ()
+
+    name: ClassVar[str] = "기자"
+    description: ClassVar[str] = "📰 **기자**\n밤마다 한 명을 취재해 누가 그를 방문했는지 알아냅니다."
+    night_action: ClassVar[bool] = True
+    priority: ClassVar[int] = 40
+
+    _MSG_NO_VISITORS: ClassVar[str] = "취재 결과: 아무도 {name}을(를) 방문하지 않았습니다."
+    _MSG_VISITORS: ClassVar[str] = "취재 결과: {visitors}이(가) {name}을(를) 방문했습니다."
+
+    get_night_action_targets = make_target_filter("pid != self.player_id")
+
+    def perform_night_action(self, target_id, players, night_actions):
+        visits = night_actions.get("_visits")
+        if visits is not None:
+            visitors = [
+                actor_id
+                for actor_id in visits.get(target_id, [])
+                if actor_id != self.player_id
+            ]
+        else:
+            # 역색인이 없으면 정규 행동 로그에서 방문자를 찾습니다.
+            visitors = [
+                action.actor_id
+                for action in night_actions.get("actions", ())
+                if action.target_id == target_id
+                and action.actor_id != self.player_id
+            ]
+        night_actions.setdefault("reporter_investigate", {})[self.player_id] = {
+            "target_id": target_id,
+            "visitors": visitors,
+        }
+        return night_actions
+
+    def get_night_action_result(self, players, night_actions):
+        investigation = night_actions.get("reporter_investigate", {}).get(
+            self.player_id
+        )
+        if not investigation:
+            return None
+        target_id = investigation.get("target_id")
+        target = players.get(target_id)
+        target_name = target.get("name", "알 수 없음") if target else "알 수 없음"
+        visitors = investigation.get("visitors", [])
+        if not visitors:
+            return self._MSG_NO_VISITORS.format(name=target_name)
+        get_player = players.get
+        names = ", ".join(
+            get_player(visitor_id)["name"]
+            for visitor_id in visitors
+            if visitor_id in players
+        )
+        return self._MSG_VISITORS.format(visitors=names, name=target_name)
+
+    def check_win_condition(self, players, snap=None):
+        return Citizen.check_win_condition(self, players, snap)
+
+
+class Agitator(BaseRole):
+    """선동가. 투표 시 추가 표를 행사합니다."""
+
+    __slots__ = ("vote_weight",)
+
+    name: ClassVar[str] = "선동가"
+    description: ClassVar[str] = "📢 **선동가**\n투표할 때 추가 표를 행사합니다."
+
+    def __init__(self, player_id):
+        super().__init__(player_id)
+        # 기본 1표 + 추가 2표. 상수를 미리 합쳐 두고 그대로 돌려줍니다.
+        self.vote_weight = 3
+
+    def perform_night_action(self, _target_id, _players, night_actions):
+        return night_actions
+
+    def on_voted(self, _players):
+        return self.vote_weight
+
+    def check_win_condition(self, players, snap=None):
+        return Citizen.check_win_condition(self, players, snap)
@@ -0,0 +1,12 @@
+"""역할 모듈들이 공유하는 intern된 문자열 상수.
+
+CPython은 비ASCII 리터럴을 항상 intern하지 않으므로, 팀 이름을
+여기서 한 번 intern해 두면 모든 모듈이 같은 객체를 참조하고
+문자열 비교가 포인터 동일성 단락을 탑니다.
+"""
+
+import sys
+
+TEAM_CITIZEN = sys.intern("시민팀")
+TEAM_MAFIA = sys.intern("마피아팀")
+TEAM_NEUTRAL = sys.intern("중립팀")
@@ -0,0 +1,55 @@
+"""마피아팀 역할들을 정의합니다."""
+
+from typing import ClassVar
+
+from mafia_bot.roles.base_role import BaseRole, GameSnapshot, Team, make_target_filter
+
+
+class Mafia(BaseRole):
+    """마피아. 밤마다 한 명을 살해합니다."""
+
+    __slots__ = ()
+
+    name: ClassVar[str] = "마피아"
+    description: ClassVar[str] = "🔪 **마피아**\n밤마다 동료들과 함께 한 명을 살해합니다."
+    team_id: ClassVar[Team] = Team.MAFIA
+    night_action: ClassVar[bool] = True
+    priority: ClassVar[int] = 90
+    visits: ClassVar[bool] = True
+
+    _MSG_KILL: ClassVar[str] = "오늘 밤 {name}을(를) 공격했습니다."
+
+    def get_night_action_targets(self, alive_ids, players):
+        game = self.game
+        if game is not None:
+            # 사망 시마다 갱신되는 증분 인덱스의 불변 튜플 캐시입니다.
+            return game.non_mafia_targets()
+        return self._filter_targets(alive_ids, players)
+
+    _filter_targets = make_target_filter(
+        "pid != self.player_id"
+        " and players[pid]['role'] is not None"
+        " and players[pid]['role'].team_id != Team.MAFIA"
+    )
+
+    def perform_night_action(self, target_id, players, night_actions):
+        night_actions["mafia_kill"] = {
+            "killer_id": self.player_id,
+            "target_id": target_id,
+        }
+        return night_actions
+
+    def get_night_action_result(self, players, night_actions):
+        kill = night_actions.get("mafia_kill")
+        if not kill:
+            return None
+        target = players.get(kill.get("target_id"))
+        target_name = target.get("name", "알 수 없음") if target else "알 수 없음"
+        return self._MSG_KILL.format(name=target_name)
+
+    def check_win_condition(self, players, snap=None):
+        if snap is None:
+            snap = GameSnapshot.capture(players)
+        mafia_alive = snap.count(Team.MAFIA)
+        citizen_alive = snap.count(Team.CITIZEN)
+        return mafia_alive > 0 and mafia_alive >= citizen_alive
@@ -0,0 +1,153 @@
+"""서브 직업을 가진 마피아 역할을 정의합니다."""
+
+from typing import Callable, ClassVar, Dict, Tuple
+
+from mafia_bot.roles.citizen_roles import Reporter
+from mafia_bot.roles.mafia_roles import Mafia
+
+
+class MafiaWithSubRole(Mafia):
+    """서브 직업(기자/선동가/시민)을 겸직하는 마피아.
+
+    action_type이 "kill"이면 일반 마피아처럼 살해하고,
+    "sub_role"이면 서브 직업의 능력을 사용합니다.
+    밤 행동/결과 구현은 설정이 바뀔 때 한 번만 바인딩해 두므로
+    매 호출마다 문자열 분기를 타지 않습니다.
+    """
+
+    __slots__ = (
+        "sub_role",
+        "sub_role_used",
+        "action_type",
+        "_perform_fn",
+        "_result_fn",
+    )
+
+    sub_roles: ClassVar[Tuple[str, ...]] = ("기자", "선동가", "시민")
+
+    _SUB_ROLE_DESCS: ClassVar[Dict[str, str]] = {
+        "기자": "\n📰 **서브 직업: 기자**\n밤에 취재를 할 수 있습니다.",
+        "선동가": "\n📢 **서브 직업: 선동가**\n투표할 때 추가 표를 행사합니다.",
+    }
+
+    def __init__(self, player_id):
+        super().__init__(player_id)
+        self.sub_role = None
+        self.sub_role_used = False
+        self.action_type = "kill"
+        self._rebind()
+
+    @property
+    def description(self):
+        """기본 마피아 설명에 서브 직업 설명을 붙여 파생합니다.
+
+        인스턴스마다 이어붙인 사본을 들고 있지 않고 클래스 상수에서
+        조합만 합니다.
+        """
+        sub_desc = self._SUB_ROLE_DESCS.get(self.sub_role)
+        if sub_desc is None:
+            return Mafia.description
+        return Mafia.description + sub_desc
+
+    def get_state(self):
+        return {
+            "sub_role": self.sub_role,
+            "sub_role_used": self.sub_role_used,
+            "action_type": self.action_type,
+        }
+
+    def set_state(self, state):
+        self.sub_role = state.get("sub_role")
+        self.sub_role_used = state.get("sub_role_used", False)
+        self.action_type = state.get("action_type", "kill")
+        self._rebind()
+
+    def set_sub_role(self, sub_role):
+        self.sub_role = sub_role
+        self._rebind()
+
+    def set_action_type(self, action_type):
+        self.action_type = action_type
+        self._rebind()
+
+    def _rebind(self):
+        """(action_type, sub_role) 조합에 맞는 구현을 다시 바인딩합니다."""
+        key = (self.action_type, self.sub_role)
+        self._perform_fn = self._SUB_ACTIONS.get(key, MafiaWithSubRole._do_nothing)
+        self._result_fn = self._SUB_RESULTS.get(key, MafiaWithSubRole._no_result)
+
+    @property
+    def visits(self):
+        # 살해하러 갈 때만 대상의 집을 방문합니다.
+        return self.action_type == "kill"
+
+    def perform_night_action(self, target_id, players, night_actions):
+        return self._perform_fn(self, target_id, players, night_actions)
+
+    def get_night_action_result(self, players, night_actions):
+        return self._result_fn(self, players, night_actions)
+
+    def on_voted(self, players):
+        if self.sub_role == "선동가":
+            return 3
+        return 1
+
+    # ---- (action_type, sub_role) 조합별 구현 ----
+
+    def _do_nothing(self, target_id, players, night_actions):
+        return night_actions
+
+    def _do_kill(self, target_id, players, night_actions):
+        return Mafia.perform_night_action(self, target_id, players, night_actions)
+
+    def _do_reporter(self, target_id, players, night_actions):
+        visitors = [
+            actor_id
+            for actor_id in night_actions.get("_visits", {}).get(target_id, [])
+            if actor_id != self.player_id
+        ]
+        night_actions.setdefault("reporter_investigate", {})[self.player_id] = {
+            "target_id": target_id,
+            "visitors": visitors,
+        }
+        return night_actions
+
+    def _no_result(self, players, night_actions):
+        return None
+
+    def _kill_result(self, players, night_actions):
+        return Mafia.get_night_action_result(self, players, night_actions)
+
+    def _reporter_result(self, players, night_actions):
+        investigation = night_actions.get("reporter_investigate", {}).get(
+            self.player_id
+        )
+        if not investigation:
+            return None
+        target = players.get(investigation.get("target_id"))
+        target_name = target.get("name", "알 수 없음") if target else "알 수 없음"
+        visitors = investigation.get("visitors", [])
+        if not visitors:
+            return Reporter._MSG_NO_VISITORS.format(name=target_name)
+        get_player = players.get
+        names = ", ".join(
+            get_player(visitor_id)["name"]
+            for visitor_id in visitors
+            if visitor_id in players
+        )
+        return Reporter._MSG_VISITORS.format(visitors=names, name=target_name)
+
+    _SUB_ACTIONS: ClassVar[Dict[Tuple[str, object], Callable]] = {
+        ("kill", None): _do_kill,
+        ("kill", "기자"): _do_kill,
+        ("kill", "선동가"): _do_kill,
+        ("kill", "시민"): _do_kill,
+        ("sub_role", "기자"): _do_reporter,
+    }
+    _SUB_RESULTS: ClassVar[Dict[Tuple[str, object], Callable]] = {
+        ("kill", None): _kill_result,
+        ("kill", "기자"): _kill_result,
+        ("kill", "선동가"): _kill_result,
+        ("kill", "시민"): _kill_result,
+        ("sub_role", "기자"): _reporter_result,
+    }
@@ -0,0 +1,332 @@
+"""중립팀 역할들을 정의합니다."""
+
+from typing import ClassVar
+
+from mafia_bot.roles.base_role import BaseRole, Team
+from mafia_bot.roles.mafia_roles import Mafia
+
+# 결과 메시지에서 이미 떠난 플레이어를 가리킬 때 쓰는 공용 센티널.
+# in 검사 + 인덱싱 대신 dict.get 한 번으로 이름을 얻습니다.
+_UNKNOWN = {"name": "알 수 없음"}
+
+
+class SerialKiller(BaseRole):
+    """연쇄살인마. 밤마다 한 명을 살해하며 최후의 1인이 되면 승리합니다."""
+
+    __slots__ = ("_target_cache",)
+
+    name: ClassVar[str] = "연쇄살인마"
+    description: ClassVar[str] = "🗡 **연쇄살인마**\n밤마다 한 명을 살해합니다. 혼자 살아남으면 승리합니다."
+    team_id: ClassVar[Team] = Team.NEUTRAL
+    night_action: ClassVar[bool] = True
+    priority: ClassVar[int] = 85
+    # serial_kill은 killer_id를 남기므로 원래도 기자에게 방문이 잡혔습니다.
+    visits: ClassVar[bool] = True
+
+    def __init__(self, player_id):
+        super().__init__(player_id)
+        self._target_cache = None
+
+    def get_night_action_targets(self, alive_ids, players):
+        game = self.game
+        if game is not None:
+            # UI가 같은 밤에 여러 번 폴링해도 구성이 그대로면 재사용합니다.
+            cache = self._target_cache
+            if cache is not None and cache[0] == game.alive_version:
+                return cache[1]
+            targets = list(game.alive_set - {self.player_id})
+            self._target_cache = (game.alive_version, targets)
+            return targets
+        return [pid for pid in alive_ids if pid != self.player_id]
+
+    def perform_night_action(self, target_id, players, night_actions):
+        night_actions["serial_kill"] = {
+            "killer_id": self.player_id,
+            "target_id": target_id,
+        }
+        return night_actions
+
+    def get_night_action_result(self, players, night_actions):
+        kill = night_actions.get("serial_kill")
+        if not kill or kill.get("killer_id") != self.player_id:
+            return None
+        target_name = players.get(kill.get("target_id"), _UNKNOWN)["name"]
+        return f"오늘 밤 {target_name}을(를) 공격했습니다."
+
+    def check_win_condition(self, players, snap=None):
+        game = self.game
+        if game is not None and game.started:
+            return game.alive_set == {self.player_id}
+        me = players.get(self.player_id)
+        if not me or not me.get("alive", True):
+            return False
+        # any()는 C에서 단락 평가되므로 생존자를 만나는 즉시 끝납니다.
+        return not any(
+            pid != self.player_id and player.get("alive", True)
+            for pid, player in players.items()
+        )
+
+
+class CultistGroup:
+    """한 교단의 모든 교도가 공유하는 신도 집합 컨테이너.
+
+    교도마다 집합 사본을 들고 다니면 포교 때마다 복사가 일어나고
+    같은 밤의 포교가 서로에게 보이지 않으므로, set 하나를 모두가
+    참조합니다.
+    """
+
+    __slots__ = ("members",)
+
+    def __init__(self, members=None):
+        self.members = set(members) if members else set()
+
+
+class Cultist(BaseRole):
+    """교주. 밤마다 한 명을 포교해 신도로 만들며 전원 포교 시 승리합니다."""
+
+    __slots__ = ("group",)
+
+    name: ClassVar[str] = "교주"
+    description: ClassVar[str] = "🙏 **교주**\n밤마다 한 명을 포교합니다. 살아있는 전원이 신도가 되면 승리합니다."
+    team_id: ClassVar[Team] = Team.NEUTRAL
+    night_action: ClassVar[bool] = True
+    priority: ClassVar[int] = 65
+
+    def __init__(self, player_id, group=None):
+        super().__init__(player_id)
+        self.group = group if group is not None else CultistGroup()
+        self.group.members.add(player_id)
+
+    @property
+    def cultists(self):
+        """공유 교단 집합. 기존 호출자와의 호환용 접근자입니다."""
+        return self.group.members
+
+    def on_assigned(self):
+        self.game.stat_counters["cultist_alive"] = self._count_alive_cultists
+
+    def get_state(self):
+        return {"members": sorted(self.group.members)}
+
+    def set_state(self, state):
+        self.group.members = set(state.get("members", (self.player_id,)))
+
+    def _count_alive_cultists(self, alive_set):
+        return len(alive_set & self.group.members)
+
+    def get_night_action_targets(self, alive_ids, players):
+        cultists = self.group.members
+        game = self.game
+        if game is not None:
+            return list(game.alive_set - cultists)
+        return [pid for pid in alive_ids if pid not in cultists]
+
+    def perform_night_action(self, target_id, players, night_actions):
+        night_actions["cultist_convert"] = {
+            "cultist_id": self.player_id,
+            "target_id": target_id,
+            "success": True,
+        }
+        target = players.get(target_id)
+        target_role = target.get("role") if target else None
+        # 타입 검사 한 번이면 마피아 파생 역할까지 전부 걸러집니다.
+        if isinstance(target_role, Mafia):
+            night_actions["cultist_convert"]["success"] = False
+        return night_actions
+
+    def on_day_start(self, players, night_actions):
+        convert = night_actions.get("cultist_convert")
+        if not convert or convert.get("cultist_id") != self.player_id:
+            return None
+        if not convert.get("success"):
+            return None
+        target_id = convert.get("target_id")
+        target = players.get(target_id)
+        if not target or not target.get("alive", True):
+            return None
+        # 같은 그룹 객체를 새 교도에게 넘겨 사본 없이 전역적으로 보이게 합니다.
+        new_cultist = Cultist(target_id, self.group)
+        game = self.game
+        if game is not None:
+            # 팀 인덱스까지 함께 옮기도록 교체는 전용 훅을 거칩니다.
+            game.replace_role(target_id, new_cultist)
+        else:
+            players[target_id]["role"] = new_cultist
+        return None
+
+    def get_night_action_result(self, players, night_actions):
+        convert = night_actions.get("cultist_convert")
+        if not convert or convert.get("cultist_id") != self.player_id:
+            return None
+        target_name = players.get(convert.get("target_id"), _UNKNOWN)["name"]
+        if convert.get("success"):
+            return f"🙏 {target_name}을(를) 포교했습니다."
+        return f"🙏 {target_name}의 포교에 실패했습니다."
+
+    def check_win_condition(self, players, snap=None):
+        game = self.game
+        if game is not None and game.started:
+            stats = game.alive_stats
+            if stats is not None:
+                return (
+                    self.player_id in game.alive_set
+                    and stats.cultist_alive == stats.total
+                )
+            alive = game.alive_set
+            return self.player_id in alive and not (alive - self.cultists)
+        for pid, player in players.items():
+            if player.get("alive", True) and pid not in self.cultists:
+                return False
+        me = players.get(self.player_id)
+        return bool(me and me.get("alive", True))
+
+
+class Cupid(BaseRole):
+    """큐피드. 첫날 밤 두 명을 연인으로 맺어줍니다."""
+
+    __slots__ = ("used_ability", "lovers")
+
+    name: ClassVar[str] = "큐피드"
+    description: ClassVar[str] = "💘 **큐피드**\n첫날 밤 두 명을 연인으로 맺습니다. 연인만 살아남으면 승리합니다."
+    team_id: ClassVar[Team] = Team.NEUTRAL
+    night_action: ClassVar[bool] = True
+    priority: ClassVar[int] = 95
+    target_count: ClassVar[int] = 2
+
+    def __init__(self, player_id):
+        super().__init__(player_id)
+        self.used_ability = False
+        self.lovers = []
+
+    def on_assigned(self):
+        self.game.stat_counters["lover_alive"] = self._count_alive_lovers
+
+    def get_state(self):
+        return {"used_ability": self.used_ability, "lovers": list(self.lovers)}
+
+    def set_state(self, state):
+        self.used_ability = state.get("used_ability", False)
+        self.lovers = list(state.get("lovers", ()))
+
+    def _count_alive_lovers(self, alive_set):
+        return len(alive_set.intersection(self.lovers))
+
+    def get_night_action_targets(self, alive_ids, players):
+        if self.used_ability:
+            return []
+        game = self.game
+        if game is not None:
+            return list(game.alive_set)
+        return list(alive_ids)
+
+    def perform_night_action(self, target_ids, players, night_actions):
+        if self.used_ability or not target_ids or len(target_ids) != 2:
+            return night_actions
+        self.used_ability = True
+        self.lovers = list(target_ids)
+        night_actions["cupid_link"] = {
+            "cupid_id": self.player_id,
+            "lovers": list(target_ids),
+        }
+        return night_actions
+
+    def get_night_action_result(self, players, night_actions):
+        link = night_actions.get("cupid_link")
+        if not link or link.get("cupid_id") != self.player_id:
+            return None
+        lovers = link.get("lovers", [])
+        if len(lovers) != 2:
+            return None
+        name1 = players.get(lovers[0], _UNKNOWN)["name"]
+        name2 = players.get(lovers[1], _UNKNOWN)["name"]
+        return f"💘 {name1}과(와) {name2}이(가) 연인이 되었습니다."
+
+    def check_win_condition(self, players, snap=None):
+        if len(self.lovers) != 2:
+            return False
+        game = self.game
+        if game is not None and game.started:
+            stats = game.alive_stats
+            if stats is not None:
+                return stats.total == 2 and stats.lover_alive == 2
+            return game.alive_set == set(self.lovers)
+        lovers = set(self.lovers)
+        if any(
+            pid not in lovers and player.get("alive", True)
+            for pid, player in players.items()
+        ):
+            return False
+        return all(
+            pid in players and players[pid].get("alive", True) for pid in lovers
+        )
+
+
+class Thief(BaseRole):
+    """도둑. 게임 중 한 번 다른 플레이어의 역할을 훔칩니다."""
+
+    __slots__ = ("used_ability", "stolen_role", "_target_cache")
+
+    name: ClassVar[str] = "도둑"
+    description: ClassVar[str] = "🎭 **도둑**\n게임 중 한 번 다른 플레이어의 역할을 훔쳐 자신의 것으로 만듭니다."
+    team_id: ClassVar[Team] = Team.NEUTRAL
+    night_action: ClassVar[bool] = True
+    priority: ClassVar[int] = 75
+
+    def __init__(self, player_id):
+        super().__init__(player_id)
+        self.used_ability = False
+        self.stolen_role = None
+        self._target_cache = None
+
+    def get_state(self):
+        return {
+            "used_ability": self.used_ability,
+            "stolen_role": type(self.stolen_role).__name__
+            if self.stolen_role is not None
+            else None,
+        }
+
+    def set_state(self, state):
+        self.used_ability = state.get("used_ability", False)
+        stolen_name = state.get("stolen_role")
+        if stolen_name:
+            import mafia_bot.roles as roles
+
+            role_cls = getattr(roles, stolen_name, None)
+            if role_cls is not None:
+                self.stolen_role = role_cls(self.player_id)
+
+    def get_night_action_targets(self, alive_ids, players):
+        if self.used_ability:
+            return []
+        game = self.game
+        if game is not None:
+            cache = self._target_cache
+            if cache is not None and cache[0] == game.alive_version:
+                return cache[1]
+            targets = list(game.alive_set - {self.player_id})
+            self._target_cache = (game.alive_version, targets)
+            return targets
+        return [pid for pid in alive_ids if pid != self.player_id]
+
+    def perform_night_action(self, target_id, players, night_actions):
+        if self.used_ability:
+            return night_actions
+        target = players.get(target_id)
+        if not target or not target.get("role"):
+            return night_actions
+        self.used_ability = True
+        # 대상 id만 기록합니다. 역할 복제는 행동이 뒤바뀌거나 도둑이
+        # 밤에 죽으면 헛수고이므로 해소 단계에서 엔진이 수행합니다.
+        night_actions["thief_steal"] = {
+            "thief_id": self.player_id,
+            "target_id": target_id,
+        }
+        return night_actions
+
+    def get_night_action_result(self, players, night_actions):
+        steal = night_actions.get("thief_steal")
+        if not steal or steal.get("thief_id") != self.player_id:
+            return None
+        target_name = players.get(steal.get("target_id"), _UNKNOWN)["name"]
+        return f"🎭 {target_name}의 역할을 훔쳤습니다."
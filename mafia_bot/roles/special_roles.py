@@ -0,0 +1,204 @@
+"""특수 역할들을 정의합니다."""
+
+from typing import Callable, ClassVar, Dict
+
+from mafia_bot.roles.base_role import BaseRole, Team
+
+
+def _swap_target(action_data, a, b):
+    """action_data의 target_id가 a/b 중 하나면 서로 맞바꿉니다."""
+    target_id = action_data.get("target_id")
+    if target_id == a:
+        action_data["target_id"] = b
+    elif target_id == b:
+        action_data["target_id"] = a
+
+
+def _swap_target_many(actions_by_actor, a, b):
+    """행위자 id로 인덱싱된 행동 dict의 각 항목에 대해 대상을 맞바꿉니다."""
+    for action_data in actions_by_actor.values():
+        _swap_target(action_data, a, b)
+
+
+# 버스기사가 뒤섞을 수 있는 밤 행동과 그 id 필드를 맞바꾸는 핸들러.
+# 리플렉션으로 *_id 필드를 훑는 대신 행동별로 정확한 필드만 교환합니다.
+SWAP_HANDLERS: Dict[str, Callable[[dict, int, int], None]] = {
+    "mafia_kill": _swap_target,
+    "detective_investigate": _swap_target_many,
+    "doctor_heal": _swap_target_many,
+    "reporter_investigate": _swap_target_many,
+    "psycho_kill": _swap_target,
+    "serial_kill": _swap_target,
+    "witch_poison": _swap_target,
+    "bomber_plant": _swap_target,
+    "architect_build": _swap_target,
+    "cultist_convert": _swap_target,
+    "thief_steal": _swap_target,
+}
+
+
+class BusDriver(BaseRole):
+    """버스기사. 밤마다 두 명의 위치를 바꿔 밤 행동의 대상을 뒤섞습니다."""
+
+    __slots__ = ()
+
+    name: ClassVar[str] = "버스기사"
+    description: ClassVar[str] = "🚌 **버스기사**\n밤마다 두 명을 태워 서로의 위치를 바꿉니다."
+    night_action: ClassVar[bool] = True
+    priority: ClassVar[int] = 70
+    target_count: ClassVar[int] = 2
+
+
+    def perform_night_action(self, target_ids, players, night_actions):
+        if not target_ids or len(target_ids) != 2:
+            return night_actions
+        night_actions["bus_drive"] = {
+            "driver_id": self.player_id,
+            "target1_id": target_ids[0],
+            "target2_id": target_ids[1],
+        }
+        return night_actions
+
+    def on_night_end(self, players, night_actions):
+        drive = night_actions.get("bus_drive")
+        if not drive or drive.get("driver_id") != self.player_id:
+            return None
+        target1_id = drive["target1_id"]
+        target2_id = drive["target2_id"]
+        for action_key, handler in SWAP_HANDLERS.items():
+            action_data = night_actions.get(action_key)
+            if action_data is not None:
+                handler(action_data, target1_id, target2_id)
+        return None
+
+    def get_night_action_result(self, players, night_actions):
+        drive = night_actions.get("bus_drive")
+        if not drive or drive.get("driver_id") != self.player_id:
+            return None
+        name1 = players.get(drive["target1_id"], {}).get("name", "알 수 없음")
+        name2 = players.get(drive["target2_id"], {}).get("name", "알 수 없음")
+        return f"🚌 오늘 밤 {name1}과(와) {name2}의 위치를 바꿨습니다."
+
+
+class Psycho(BaseRole):
+    """싸이코. 중립 역할로, 밤마다 한 명을 살해하며 최후의 1인을 노립니다."""
+
+    __slots__ = ()
+
+    name: ClassVar[str] = "싸이코"
+    description: ClassVar[str] = "🔪 **싸이코**\n밤마다 한 명을 살해합니다. 혼자 살아남으면 승리합니다."
+    team_id: ClassVar[Team] = Team.NEUTRAL
+    night_action: ClassVar[bool] = True
+    priority: ClassVar[int] = 80
+    is_psycho: ClassVar[bool] = True
+
+    def get_night_action_targets(self, alive_ids, players):
+        return self._targets_except_self(alive_ids)
+
+    def perform_night_action(self, target_id, players, night_actions):
+        night_actions["psycho_kill"] = {
+            "psycho_id": self.player_id,
+            "target_id": target_id,
+        }
+        return night_actions
+
+    def check_win_condition(self, players, snap=None):
+        me = players.get(self.player_id)
+        if not me or not me.get("alive", True):
+            return False
+        for pid, player in players.items():
+            if pid != self.player_id and player.get("alive", True):
+                return False
+        return True
+
+
+class Witch(BaseRole):
+    """마녀. 치료 물약과 독 물약을 한 번씩 사용할 수 있습니다."""
+
+    __slots__ = ("heal_potion", "poison_potion")
+
+    name: ClassVar[str] = "마녀"
+    description: ClassVar[str] = "🧙 **마녀**\n독 물약으로 한 명을 독살하거나 치료 물약으로 살릴 수 있습니다."
+    team_id: ClassVar[Team] = Team.NEUTRAL
+    night_action: ClassVar[bool] = True
+    priority: ClassVar[int] = 55
+
+    def __init__(self, player_id):
+        super().__init__(player_id)
+        self.heal_potion = True
+        self.poison_potion = True
+
+    def get_state(self):
+        return {
+            "heal_potion": self.heal_potion,
+            "poison_potion": self.poison_potion,
+        }
+
+    def set_state(self, state):
+        self.heal_potion = state.get("heal_potion", True)
+        self.poison_potion = state.get("poison_potion", True)
+
+    def get_night_action_targets(self, alive_ids, players):
+        return [pid for pid in alive_ids if pid != self.player_id]
+
+    def perform_night_action(self, target_id, players, night_actions):
+        if not self.poison_potion:
+            return night_actions
+        self.poison_potion = False
+        night_actions["witch_poison"] = {
+            "witch_id": self.player_id,
+            "target_id": target_id,
+        }
+        return night_actions
+
+
+class Bomber(BaseRole):
+    """폭탄마. 밤마다 한 명에게 폭탄을 설치합니다."""
+
+    __slots__ = ("bomb_targets",)
+
+    name: ClassVar[str] = "폭탄마"
+    description: ClassVar[str] = "💣 **폭탄마**\n밤마다 한 명에게 폭탄을 설치합니다. 자신이 처형되면 폭탄이 터집니다."
+    team_id: ClassVar[Team] = Team.NEUTRAL
+    night_action: ClassVar[bool] = True
+    priority: ClassVar[int] = 45
+
+    def __init__(self, player_id):
+        super().__init__(player_id)
+        self.bomb_targets = []
+
+    def get_state(self):
+        return {"bomb_targets": list(self.bomb_targets)}
+
+    def set_state(self, state):
+        self.bomb_targets = list(state.get("bomb_targets", []))
+
+    def get_night_action_targets(self, alive_ids, players):
+        return [pid for pid in alive_ids if pid != self.player_id]
+
+    def perform_night_action(self, target_id, players, night_actions):
+        self.bomb_targets.append(target_id)
+        night_actions["bomber_plant"] = {
+            "bomber_id": self.player_id,
+            "target_id": target_id,
+        }
+        return night_actions
+
+
+class Architect(BaseRole):
+    """건축가. 밤마다 한 명의 집을 보강해 방문을 차단합니다."""
+
+    __slots__ = ()
+
+    name: ClassVar[str] = "건축가"
+    description: ClassVar[str] = "🏠 **건축가**\n밤마다 한 명의 집을 보강해 그날 밤 방문을 모두 차단합니다."
+    night_action: ClassVar[bool] = True
+    priority: ClassVar[int] = 35
+
+
+    def perform_night_action(self, target_id, players, night_actions):
+        night_actions["architect_build"] = {
+            "architect_id": self.player_id,
+            "target_id": target_id,
+        }
+        return night_actions
@@ -0,0 +1 @@
+"""설정·상태 저장과 메시지 전송 유틸리티."""
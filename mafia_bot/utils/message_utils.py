@@ -0,0 +1,171 @@
+"""텔레그램 메시지 전송 헬퍼."""
+
+import asyncio
+import logging
+from collections import Counter
+
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.constants import ParseMode
+from telegram.error import TelegramError
+
+from mafia_bot.utils.outbox import outbox
+from mafia_bot.utils.rate_limiter import limiter
+
+logger = logging.getLogger(__name__)
+
+# 단계 전환 문구·키보드는 호출마다 새로 만들지 않고 모듈 상수로 재사용합니다.
+_DAY_TPL = "☀️ {}일차 낮이 되었습니다.\n\n마을 회의를 통해 마피아로 의심되는 사람을 투표로 처형하세요."
+_NIGHT_TPL = "🌙 {}일차 밤이 되었습니다.\n\n능력자들은 개인 메시지로 밤 행동을 수행하세요."
+_VOTE_TEXT = "🗳 투표가 시작되었습니다."
+_VOTE_MARKUP = InlineKeyboardMarkup(
+    [[InlineKeyboardButton("투표하기", callback_data="vote")]]
+)
+_NIGHT_ACTION_MARKUP = InlineKeyboardMarkup(
+    [[InlineKeyboardButton("밤 행동 수행", callback_data="night_action")]]
+)
+
+
+async def send_message(context, chat_id, text, reply_markup=None):
+    """일반 텍스트 메시지를 전송합니다."""
+    try:
+        await limiter.send(
+            context.bot,
+            chat_id=chat_id,
+            text=text,
+            reply_markup=reply_markup,
+            parse_mode=ParseMode.MARKDOWN,
+        )
+    except TelegramError as e:
+        logger.error("메시지 전송 중 오류 발생: %s", e)
+
+
+async def send_game_status(context, chat_id, game_manager):
+    """현재 게임 상태를 전송합니다."""
+    text = "".join(
+        (
+            "🎮 *마피아 게임*\n\n",
+            f"단계: {game_manager.phase}\n",
+            f"{game_manager.day_count}일차\n\n",
+            game_manager.get_player_list_text(),
+        )
+    )
+    try:
+        await limiter.send(
+            context.bot, chat_id=chat_id, text=text, parse_mode=ParseMode.MARKDOWN
+        )
+    except TelegramError as e:
+        logger.error("게임 상태 전송 중 오류 발생: %s", e)
+
+
+async def send_role_info(context, chat_id, player):
+    """플레이어에게 자신의 역할 정보를 개인 메시지로 전송합니다."""
+    role = player["role"]
+    text = f"🎭 당신의 역할: {role.name}\n\n{role.get_role_info()}"
+    keyboard = _NIGHT_ACTION_MARKUP if role.night_action else None
+    try:
+        await limiter.send(
+            context.bot,
+            chat_id=chat_id,
+            text=text,
+            reply_markup=keyboard,
+            parse_mode=ParseMode.MARKDOWN,
+        )
+    except TelegramError as e:
+        logger.error("역할 정보 전송 중 오류 발생: %s", e)
+
+
+async def broadcast_role_info(context, players):
+    """모든 플레이어에게 역할 정보를 동시에 전송합니다.
+
+    순차 await는 인원수 × 왕복 지연만큼 걸리므로 gather로 한꺼번에
+    띄웁니다. 전송 속도는 limiter가 맞추고, 개별 실패가 나머지
+    전송을 막지 않도록 return_exceptions를 켭니다.
+    """
+    await asyncio.gather(
+        *(
+            send_role_info(context, player_id, player)
+            for player_id, player in players.items()
+        ),
+        return_exceptions=True,
+    )
+
+
+async def send_phase_change_message(context, chat_id, phase, day_count):
+    """단계 전환 안내 메시지를 전송합니다."""
+    try:
+        if phase == "낮":
+            await limiter.send(
+                context.bot,
+                chat_id=chat_id,
+                text=_DAY_TPL.format(day_count),
+                reply_markup=_VOTE_MARKUP,
+                parse_mode=ParseMode.MARKDOWN,
+            )
+        elif phase == "밤":
+            outbox.enqueue(context.bot, chat_id, _NIGHT_TPL.format(day_count))
+        else:
+            outbox.enqueue(context.bot, chat_id, _VOTE_TEXT)
+    except TelegramError as e:
+        logger.error("단계 전환 메시지 전송 중 오류 발생: %s", e)
+
+
+async def send_death_message(context, chat_id, player_name, role_name=None):
+    """사망 공지 메시지를 전송합니다."""
+    text = f"⚰️ {player_name}이(가) 사망했습니다."
+    if role_name:
+        text += f"\n역할: {role_name}"
+    # 같은 해소 틱에 생긴 공지들과 한 메시지로 합쳐 보냅니다.
+    outbox.enqueue(context.bot, chat_id, text)
+
+
+async def send_vote_result(context, chat_id, vote_results, player_names, executed_name=None):
+    """투표 결과를 전송합니다."""
+    # 아무도 투표하지 않은 흔한 경로는 집계 없이 바로 끝냅니다.
+    if not vote_results:
+        outbox.enqueue(
+            context.bot, chat_id, "📊 *투표 결과*\n\n아무도 투표하지 않았습니다."
+        )
+        return
+    parts = ["📊 *투표 결과*\n\n"]
+    # C 구현 힙을 쓰는 most_common이 작은 dict에서도 sorted보다 빠릅니다.
+    parts.extend(
+        f"{player_names.get(target_id, '알 수 없음')}: {votes}표\n"
+        for target_id, votes in Counter(vote_results).most_common()
+    )
+    parts.append("\n")
+    if executed_name:
+        parts.append(f"⚖️ {executed_name}이(가) 처형되었습니다.")
+    else:
+        parts.append("동률로 아무도 처형되지 않았습니다.")
+    outbox.enqueue(context.bot, chat_id, "".join(parts))
+
+
+async def send_game_end_message(context, chat_id, winning_team, players):
+    """게임 종료 메시지를 전송합니다."""
+    parts = [
+        f"🎉 *게임 종료!*\n\n{winning_team}의 승리입니다!\n\n",
+        "*최종 역할 공개*\n",
+    ]
+    for player_id, player in players.items():
+        role = player.get("role")
+        role_name = role.name if role else "없음"
+        status = "🟢" if player.get("alive", True) else "⚰️"
+        parts.append(f"{status} {player['name']}: {role_name}\n")
+    text = "".join(parts)
+    try:
+        await limiter.send(
+            context.bot, chat_id=chat_id, text=text, parse_mode=ParseMode.MARKDOWN
+        )
+    except TelegramError as e:
+        logger.error("게임 종료 메시지 전송 중 오류 발생: %s", e)
+
+
+async def send_error_message(context, chat_id, message):
+    """오류 안내 메시지를 전송합니다."""
+    text = f"⚠️ {message}"
+    try:
+        await limiter.send(
+            context.bot, chat_id=chat_id, text=text, parse_mode=ParseMode.MARKDOWN
+        )
+    except TelegramError as e:
+        logger.error("오류 메시지 전송 중 오류 발생: %s", e)
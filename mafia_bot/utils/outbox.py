@@ -0,0 +1,71 @@
+"""채팅방별 메시지 출고함.
+
+밤·낮 해소 시점에는 사망 공지, 투표 결과, 단계 전환 안내가 연달아
+만들어집니다. 건마다 API를 호출하면 그룹당 전송 한도에 바로 걸리므로,
+짧은 창(기본 0.2초) 안에 쌓인 텍스트를 빈 줄로 이어 한 번의
+send_message로 내보냅니다. 텔레그램 메시지 길이 한도(4096자)에
+가까워지면 창이 끝나기 전에 먼저 플러시합니다.
+"""
+
+import asyncio
+import logging
+
+from telegram.constants import ParseMode
+from telegram.error import TelegramError
+
+from mafia_bot.utils.rate_limiter import limiter
+
+logger = logging.getLogger(__name__)
+
+# 4096자 한도에 마진을 둔 조기 플러시 임계값.
+_FLUSH_THRESHOLD = 4000
+_MESSAGE_LIMIT = 4096
+
+
+class ChatOutbox:
+    """같은 창에 들어온 채팅방별 메시지를 하나로 합쳐 전송합니다."""
+
+    def __init__(self, flush_interval=0.2):
+        self.flush_interval = flush_interval
+        self._pending = {}
+        self._sizes = {}
+        self._tasks = {}
+
+    def enqueue(self, bot, chat_id, text):
+        """텍스트를 출고함에 쌓고 플러시를 예약합니다."""
+        self._pending.setdefault(chat_id, []).append(text)
+        self._sizes[chat_id] = self._sizes.get(chat_id, 0) + len(text) + 2
+        if self._sizes[chat_id] >= _FLUSH_THRESHOLD:
+            task = self._tasks.pop(chat_id, None)
+            if task is not None:
+                task.cancel()
+            self._tasks[chat_id] = asyncio.create_task(self.flush(bot, chat_id))
+        elif chat_id not in self._tasks:
+            self._tasks[chat_id] = asyncio.create_task(
+                self._flush_later(bot, chat_id)
+            )
+
+    async def _flush_later(self, bot, chat_id):
+        await asyncio.sleep(self.flush_interval)
+        await self.flush(bot, chat_id)
+
+    async def flush(self, bot, chat_id):
+        """쌓인 텍스트를 합쳐 전송합니다. 한도 초과분은 나눠 보냅니다."""
+        self._tasks.pop(chat_id, None)
+        self._sizes.pop(chat_id, None)
+        parts = self._pending.pop(chat_id, None)
+        if not parts:
+            return
+        text = "\n\n".join(parts)
+        try:
+            while text:
+                piece, text = text[:_MESSAGE_LIMIT], text[_MESSAGE_LIMIT:]
+                await limiter.send(
+                    bot, chat_id=chat_id, text=piece, parse_mode=ParseMode.MARKDOWN
+                )
+        except TelegramError as e:
+            logger.error("출고함 플러시 중 오류 발생: %s", e)
+
+
+# 프로세스 전체가 공유하는 단일 출고함.
+outbox = ChatOutbox()
@@ -0,0 +1,65 @@
+"""텔레그램 전송 속도 제한기.
+
+텔레그램은 전역 초당 30건, 그룹당 분당 20건 수준의 한도를 넘는 전송에
+RetryAfter(수 분짜리 대기)를 돌려줍니다. 모든 전송을 토큰 버킷 두 개
+(전역/채팅방별)로 미리 보조를 맞춰 429 백오프 자체가 일어나지 않게
+합니다.
+"""
+
+import asyncio
+import time
+from collections import defaultdict
+
+from telegram.error import RetryAfter
+
+
+class TokenBucket:
+    """asyncio 토큰 버킷. capacity개의 토큰이 period초에 걸쳐 채워집니다."""
+
+    __slots__ = ("capacity", "period", "_tokens", "_updated", "_lock")
+
+    def __init__(self, capacity, period):
+        self.capacity = capacity
+        self.period = period
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """토큰 하나를 얻을 때까지 필요한 만큼만 잠듭니다."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                refill = (now - self._updated) * (self.capacity / self.period)
+                self._tokens = min(self.capacity, self._tokens + refill)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep(
+                    (1.0 - self._tokens) * (self.period / self.capacity)
+                )
+
+
+class RateLimitedSender:
+    """전역/채팅방별 한도를 지키며 send_message를 대신 호출하는 래퍼."""
+
+    def __init__(
+        self, global_rate=30, global_period=1.0, chat_rate=20, chat_period=60.0
+    ):
+        self._global_bucket = TokenBucket(global_rate, global_period)
+        self._chat_buckets = defaultdict(lambda: TokenBucket(chat_rate, chat_period))
+
+    async def send(self, bot, chat_id, **kwargs):
+        """버킷을 통과한 뒤 전송합니다. RetryAfter가 오면 기다렸다 재시도합니다."""
+        await self._global_bucket.acquire()
+        await self._chat_buckets[chat_id].acquire()
+        while True:
+            try:
+                return await bot.send_message(chat_id=chat_id, **kwargs)
+            except RetryAfter as e:
+                await asyncio.sleep(e.retry_after)
+
+
+# 프로세스 전체가 공유하는 단일 제한기.
+limiter = RateLimitedSender()
@@ -0,0 +1,182 @@
+"""채팅방별 게임 설정을 관리합니다."""
+
+import asyncio
+import logging
+import os
+from types import MappingProxyType
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+def _freeze(value):
+    """중첩 dict를 읽기 전용 MappingProxyType으로 감쌉니다."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    return value
+
+
+def _thaw(value):
+    """_freeze된 구조에서 가변 dict 사본을 만듭니다."""
+    if isinstance(value, MappingProxyType):
+        return {k: _thaw(v) for k, v in value.items()}
+    return value
+
+
+class SettingsManager:
+    """기본 설정과 채팅방별 오버라이드를 관리합니다."""
+
+    def __init__(self, settings_file="settings.json"):
+        self.settings_file = settings_file
+        # 기본 설정은 읽기 전용으로 동결해 실수로 오버라이드가
+        # 기본값을 오염시키는 일을 막습니다. 가변 사본은 쓰기 경로
+        # (_thaw)에서만 만듭니다.
+        self.default_settings = _freeze({
+            "min_players": 4,
+            "max_players": 20,
+            "day_duration": 120,
+            "night_duration": 60,
+            "vote_duration": 30,
+            "enabled_roles": {
+                "마피아": True,
+                "경찰": True,
+                "의사": True,
+                "기자": False,
+                "선동가": False,
+                "버스기사": False,
+                "싸이코": False,
+                "마녀": False,
+                "폭탄마": False,
+                "건축가": False,
+                "연쇄살인마": False,
+                "교주": False,
+                "큐피드": False,
+                "도둑": False,
+            },
+            "role_counts": {
+                "마피아": 1,
+                "경찰": 1,
+                "의사": 1,
+            },
+        })
+        self.settings = {"chats": {}}
+        # 병합된 채팅방별 설정의 메모이즈 캐시. 핫 패스가 매번
+        # 복사+병합을 반복하지 않도록 쓰기 경로에서만 무효화합니다.
+        self._chat_cache = {}
+        # StateManager와 같은 write-behind 버퍼(500ms 병합).
+        self._dirty = False
+        self._flush_task = None
+        self.load_settings()
+
+    def load_settings(self):
+        """설정 파일을 읽어옵니다. 키는 int chat_id로 정규화합니다."""
+        if not os.path.exists(self.settings_file):
+            self.settings = {"chats": {}}
+            return
+        try:
+            with open(self.settings_file, "rb") as f:
+                self.settings = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            logger.exception("설정 파일을 읽는 중 오류 발생")
+            self.settings = {"chats": {}}
+        chats = {}
+        for key, overrides in self.settings.get("chats", {}).items():
+            try:
+                chats[int(key)] = overrides
+            except (TypeError, ValueError):
+                continue
+        self.settings["chats"] = chats
+
+    def save_settings(self):
+        """설정을 더티로 표시하고 지연 쓰기를 예약합니다."""
+        self._dirty = True
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        if self._flush_task is not None and not self._flush_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._flush()
+            return
+        self._flush_task = loop.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        await asyncio.sleep(0.5)
+        self._flush()
+
+    def _flush(self):
+        """더티 설정을 임시 파일에 쓴 뒤 원자적으로 바꿔치기합니다."""
+        if not self._dirty:
+            return
+        self._dirty = False
+        tmp = self.settings_file + ".tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(
+                    orjson.dumps(
+                        self.settings,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                    )
+                )
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.settings_file)
+        except OSError:
+            logger.exception("설정 파일을 저장하는 중 오류 발생")
+
+    async def aclose(self):
+        """종료 시 예약된 쓰기를 취소하고 마지막으로 플러시합니다."""
+        task = self._flush_task
+        self._flush_task = None
+        if task is not None and not task.done():
+            task.cancel()
+        self._flush()
+
+    def get_chat_settings(self, chat_id):
+        """기본 설정에 채팅방 오버라이드를 합친 설정을 반환합니다."""
+        cached = self._chat_cache.get(chat_id)
+        if cached is not None:
+            return cached
+        settings = _thaw(self.default_settings)
+        overrides = self.settings.get("chats", {}).get(chat_id, {})
+        self._deep_update(settings, overrides)
+        self._chat_cache[chat_id] = settings
+        return settings
+
+    def update_chat_settings(self, chat_id, updates):
+        """채팅방 설정을 갱신하고 저장합니다."""
+        chat_settings = self.settings.setdefault("chats", {}).setdefault(chat_id, {})
+        self._deep_update(chat_settings, updates)
+        self._chat_cache.pop(chat_id, None)
+        self.save_settings()
+
+    def reset_chat_settings(self, chat_id):
+        """채팅방 설정을 기본값으로 되돌립니다."""
+        self.settings.get("chats", {}).pop(chat_id, None)
+        self._chat_cache.pop(chat_id, None)
+        self.save_settings()
+
+    def reset_settings(self):
+        """모든 채팅방 설정을 기본값으로 되돌립니다."""
+        self.settings = {"chats": {}}
+        self._chat_cache.clear()
+        self.save_settings()
+
+    def _deep_update(self, target, source):
+        """중첩 dict를 명시적 스택으로 병합합니다.
+
+        설정 dict는 깊이가 얕아 재귀 프레임 비용이 상대적으로 크므로
+        반복문으로 풉니다. 값이 동일 객체면 대입도 건너뜁니다.
+        """
+        stack = [(target, source)]
+        while stack:
+            t, s = stack.pop()
+            for k, v in s.items():
+                tv = t.get(k)
+                if isinstance(tv, dict) and isinstance(v, dict):
+                    stack.append((tv, v))
+                elif tv is not v:
+                    t[k] = v
@@ -0,0 +1,178 @@
+"""게임 상태의 저장과 복구를 관리합니다."""
+
+import asyncio
+import logging
+import os
+
+import orjson
+
+from mafia_bot.game.game_manager import GameManager
+
+logger = logging.getLogger(__name__)
+
+
+class StateManager:
+    """진행 중인 게임의 메타데이터와 GameManager 스냅샷을 저장합니다."""
+
+    def __init__(self, state_file="game_state.json", data_dir="."):
+        self.state_file = state_file
+        self.data_dir = data_dir
+        self.state = {"games": {}}
+        # 메모리의 GameManager가 항상 원본입니다. 디스크 스냅샷은
+        # 콜드 스타트 복구용이며, 같은 채팅방을 반복 로드할 때
+        # 파일을 다시 파싱하지 않습니다.
+        self._managers = {}
+        # 진행 중 게임의 chat_id 집합. 폴링마다 전체 상태를 훑지 않도록
+        # 변이 시점에 함께 유지합니다.
+        self._active_chat_ids = set()
+        # 변이마다 전체 파일을 다시 쓰지 않도록 500ms 창으로 병합하는
+        # write-behind 버퍼.
+        self._dirty = False
+        self._flush_task = None
+        self.load_state()
+
+    def load_state(self):
+        """상태 파일을 읽어옵니다. 키는 int chat_id로 정규화합니다."""
+        if not os.path.exists(self.state_file):
+            self.state = {"games": {}}
+            return
+        try:
+            with open(self.state_file, "rb") as f:
+                self.state = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            logger.exception("상태 파일을 읽는 중 오류 발생")
+            self.state = {"games": {}}
+        games = {}
+        active = set()
+        for key, game_state in self.state.get("games", {}).items():
+            try:
+                chat_id = int(key)
+            except (TypeError, ValueError):
+                continue
+            games[chat_id] = game_state
+            if game_state.get("active"):
+                active.add(chat_id)
+        self.state["games"] = games
+        self._active_chat_ids = active
+
+    def save_state(self):
+        """상태를 더티로 표시하고 지연 쓰기를 예약합니다."""
+        self._dirty = True
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        if self._flush_task is not None and not self._flush_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # 이벤트 루프 밖(동기 초기화·테스트)에서는 바로 씁니다.
+            self._flush()
+            return
+        self._flush_task = loop.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        await asyncio.sleep(0.5)
+        self._flush()
+
+    def _flush(self):
+        """더티 상태를 임시 파일에 쓴 뒤 원자적으로 바꿔치기합니다.
+
+        쓰던 도중 죽어도 기존 파일이 온전히 남도록 tmp에 완성본을
+        fsync까지 마친 뒤 os.replace로 교체합니다.
+        """
+        if not self._dirty:
+            return
+        self._dirty = False
+        tmp = self.state_file + ".tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(
+                    orjson.dumps(
+                        self.state,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                    )
+                )
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.state_file)
+        except OSError:
+            logger.exception("상태 파일을 저장하는 중 오류 발생")
+
+    async def aclose(self):
+        """종료 시 예약된 쓰기를 취소하고 마지막으로 플러시합니다."""
+        task = self._flush_task
+        self._flush_task = None
+        if task is not None and not task.done():
+            task.cancel()
+        self._flush()
+
+    def set_game_state(self, chat_id, game_state):
+        """채팅방의 게임 메타데이터를 기록합니다."""
+        self.state["games"][chat_id] = game_state
+        if game_state.get("active"):
+            self._active_chat_ids.add(chat_id)
+        else:
+            self._active_chat_ids.discard(chat_id)
+        self.save_state()
+
+    def get_game_state(self, chat_id):
+        """채팅방의 게임 메타데이터를 반환합니다."""
+        return self.state["games"].get(chat_id)
+
+    def remove_game_state(self, chat_id):
+        """채팅방의 게임 메타데이터를 삭제합니다."""
+        self.state["games"].pop(chat_id, None)
+        self._managers.pop(chat_id, None)
+        self._active_chat_ids.discard(chat_id)
+        file_path = self._game_manager_path(chat_id)
+        if os.path.exists(file_path):
+            try:
+                os.remove(file_path)
+            except OSError:
+                logger.exception("게임 파일을 삭제하는 중 오류 발생")
+        self.save_state()
+
+    def get_active_games(self):
+        """진행 중인 게임이 있는 채팅방 id 목록을 반환합니다."""
+        return list(self._active_chat_ids)
+
+    def _game_manager_path(self, chat_id):
+        return os.path.join(self.data_dir, f"game_manager_{chat_id}.json")
+
+    def save_game_manager(self, chat_id, game_manager):
+        """GameManager 스냅샷을 JSON 파일로 저장합니다."""
+        self._managers[chat_id] = game_manager
+        file_path = self._game_manager_path(chat_id)
+        try:
+            payload = orjson.dumps(
+                game_manager.to_dict(), option=orjson.OPT_NON_STR_KEYS
+            )
+            with open(file_path, "wb") as f:
+                f.write(payload)
+        except (OSError, TypeError, orjson.JSONEncodeError):
+            logger.exception("게임을 저장하는 중 오류 발생")
+            return
+        self.set_game_state(chat_id, {"active": game_manager.started})
+
+    def load_game_manager(self, chat_id):
+        """GameManager를 반환합니다. 메모리에 없으면 디스크에서 복원합니다."""
+        manager = self._managers.get(chat_id)
+        if manager is not None:
+            return manager
+        return self._load_from_disk(chat_id)
+
+    def _load_from_disk(self, chat_id):
+        """디스크 스냅샷에서 GameManager를 복원해 캐시합니다. 없으면 None."""
+        file_path = self._game_manager_path(chat_id)
+        if not os.path.exists(file_path):
+            return None
+        try:
+            with open(file_path, "rb") as f:
+                data = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            logger.exception("게임을 불러오는 중 오류 발생")
+            return None
+        manager = GameManager.from_dict(data)
+        self._managers[chat_id] = manager
+        return manager
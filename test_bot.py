@@ -0,0 +1,199 @@
+"""게임 로직 단위 테스트."""
+
+import copy
+import unittest
+from unittest.mock import MagicMock, patch
+
+from mafia_bot.game.game_manager import GameManager
+from mafia_bot.roles.base_role import GameSnapshot
+from mafia_bot.game.phase_manager import PhaseManager
+from mafia_bot.roles import Citizen, Cultist, Detective, Doctor, Mafia
+from mafia_bot.roles.base_role import Team
+
+
+def make_game_manager(settings=None, chat_id=1001, player_count=5):
+    """참가자가 등록된 GameManager를 만드는 공용 픽스처 빌더."""
+    game_manager = GameManager(settings or make_settings(), chat_id)
+    for i in range(player_count):
+        game_manager.add_player(100 + i, f"플레이어{i + 1}")
+    return game_manager
+
+
+def make_settings():
+    return {
+        "min_players": 4,
+        "max_players": 20,
+        "day_duration": 120,
+        "night_duration": 60,
+        "vote_duration": 30,
+        "enabled_roles": {"마피아": True, "경찰": True, "의사": True},
+        "role_counts": {"마피아": 1, "경찰": 1, "의사": 1},
+    }
+
+
+class TestGameManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # 불변 준비물은 한 번만 만들고, 각 테스트는 deepcopy로 받아
+        # 참가자 등록과 역할 배정을 테스트마다 반복하지 않습니다.
+        cls.settings = make_settings()
+        prototype = make_game_manager(cls.settings)
+        cls._prototype = prototype
+        started = copy.deepcopy(prototype)
+        cls._start_result = started.start_game()
+        cls._started_prototype = started
+
+    def setUp(self):
+        self.game_manager = copy.deepcopy(self._prototype)
+
+    def test_add_player(self):
+        self.assertTrue(self.game_manager.add_player(200, "새참가자"))
+        self.assertIn(200, self.game_manager.players)
+        self.assertFalse(self.game_manager.add_player(200, "중복참가자"))
+
+    def test_remove_player(self):
+        self.assertTrue(self.game_manager.remove_player(100))
+        self.assertNotIn(100, self.game_manager.players)
+        self.assertFalse(self.game_manager.remove_player(999))
+
+    def test_start_game(self):
+        game_manager = copy.deepcopy(self._started_prototype)
+        self.assertTrue(self._start_result)
+        self.assertTrue(game_manager.started)
+        roles = [p["role"] for p in game_manager.players.values()]
+        self.assertTrue(all(role is not None for role in roles))
+        mafia_count = sum(1 for role in roles if role.team == "마피아팀")
+        self.assertEqual(mafia_count, 1)
+
+    def test_start_game_not_enough_players(self):
+        game_manager = GameManager(self.settings, 1002)
+        game_manager.add_player(100, "혼자")
+        self.assertFalse(game_manager.start_game())
+
+    def test_add_player_after_start(self):
+        game_manager = copy.deepcopy(self._started_prototype)
+        self.assertFalse(game_manager.add_player(300, "늦은참가자"))
+
+    def test_kill_player(self):
+        self.assertTrue(self.game_manager.kill_player(100))
+        self.assertFalse(self.game_manager.players[100]["alive"])
+        self.assertFalse(self.game_manager.kill_player(100))
+        self.assertNotIn(100, self.game_manager.get_alive_players())
+
+    def test_mafia_targets_exclude_mafia(self):
+        players = self.game_manager.players
+        players[100]["role"] = Mafia(100)
+        players[101]["role"] = Citizen(101)
+        players[102]["role"] = Citizen(102)
+        players[103]["role"] = Doctor(103)
+        players[104]["role"] = Detective(104)
+        alive_ids = self.game_manager.refresh_alive_ids()
+        targets = players[100]["role"].get_night_action_targets(alive_ids, players)
+        self.assertNotIn(100, targets)
+        self.assertEqual(sorted(targets), [101, 102, 103, 104])
+
+    def test_night_kill_and_heal(self):
+        players = self.game_manager.players
+        players[100]["role"] = Mafia(100)
+        players[101]["role"] = Citizen(101)
+        players[102]["role"] = Doctor(102)
+        players[103]["role"] = Citizen(103)
+        players[104]["role"] = Citizen(104)
+        self.game_manager.started = True
+
+        self.game_manager.select_night_target(100, 101)
+        self.game_manager.select_night_target(102, 101)
+        deaths = self.game_manager.process_night_actions()
+        self.assertEqual(deaths, [])
+        self.assertTrue(players[101]["alive"])
+
+        self.game_manager.select_night_target(100, 103)
+        self.game_manager.select_night_target(102, 104)
+        deaths = self.game_manager.process_night_actions()
+        self.assertEqual(deaths, [103])
+        self.assertFalse(players[103]["alive"])
+
+    def test_vote_execution(self):
+        players = self.game_manager.players
+        for player_id in players:
+            players[player_id]["role"] = Citizen(player_id)
+        self.game_manager.started = True
+        for voter_id in (100, 101, 102):
+            self.assertTrue(self.game_manager.vote(voter_id, 104))
+        self.game_manager.vote(104, 100)
+        executed_id, vote_results = self.game_manager.process_vote_results()
+        self.assertEqual(executed_id, 104)
+        self.assertEqual(vote_results[104], 3)
+        self.assertFalse(players[104]["alive"])
+
+    def test_replace_role_updates_team_indexes(self):
+        game_manager = copy.deepcopy(self._started_prototype)
+        target_id = next(
+            pid
+            for pid, player in game_manager.players.items()
+            if player["role"].team_id == Team.CITIZEN
+        )
+        game_manager.replace_role(target_id, Cultist(target_id))
+        # 마스크 경로의 팀 집계가 live 스캔과 일치해야 합니다.
+        masked = GameSnapshot.from_masks(
+            game_manager._slot_of, game_manager.alive_mask, game_manager.team_masks
+        )
+        live = GameSnapshot.capture(game_manager.players)
+        for team in (Team.CITIZEN, Team.MAFIA, Team.NEUTRAL):
+            self.assertEqual(masked.count(team), live.count(team))
+        self.assertNotIn(target_id, game_manager.team_index[Team.CITIZEN])
+        self.assertIn(target_id, game_manager.team_index[Team.NEUTRAL])
+        self.assertIn(target_id, game_manager.non_mafia_alive)
+        game_manager.kill_player(target_id)
+        self.assertNotIn(target_id, game_manager.team_index[Team.CITIZEN])
+        self.assertNotIn(target_id, game_manager.team_index[Team.NEUTRAL])
+        stats = game_manager.compute_alive_stats()
+        self.assertEqual(
+            stats.by_team[Team.CITIZEN],
+            len(game_manager.team_index[Team.CITIZEN]),
+        )
+
+    def test_win_conditions(self):
+        players = self.game_manager.players
+        players[100]["role"] = Mafia(100)
+        for player_id in (101, 102, 103, 104):
+            players[player_id]["role"] = Citizen(player_id)
+        self.assertIsNone(self.game_manager.check_game_end())
+
+        players[100]["alive"] = False
+        self.assertEqual(self.game_manager.check_game_end(), "시민팀")
+
+        players[100]["alive"] = True
+        for player_id in (101, 102, 103, 104):
+            players[player_id]["alive"] = False
+        self.assertEqual(self.game_manager.check_game_end(), "마피아팀")
+
+
+# 실제 타이머 스레드를 띄우지 않도록 Timer를 테스트 동안 목으로 바꿉니다.
+@patch("mafia_bot.game.phase_manager.threading.Timer", new=MagicMock())
+class TestPhaseManager(unittest.TestCase):
+    def setUp(self):
+        self.game_manager = make_game_manager()
+        self.phase_manager = PhaseManager(self.game_manager)
+
+    def tearDown(self):
+        self.phase_manager.cancel()
+
+    def test_start_night_phase(self):
+        self.phase_manager.start_night_phase(duration=3600)
+        self.assertEqual(self.game_manager.phase, "밤")
+
+    def test_night_to_day_transition(self):
+        self.game_manager.day_count = 1
+        self.phase_manager.start_night_phase(duration=3600)
+        self.phase_manager.end_night_phase()
+        self.assertEqual(self.game_manager.phase, "낮")
+        self.assertEqual(self.game_manager.day_count, 2)
+
+    def test_vote_phase(self):
+        self.phase_manager.start_vote_phase(duration=3600)
+        self.assertEqual(self.game_manager.phase, "투표")
+
+
+if __name__ == "__main__":
+    unittest.main()